@@ -8,7 +8,7 @@ import logging
 
 from ..database.connection import get_db
 from ..models.resource import Resource
-from ..utils.ai_processor import AIProcessor
+from ..utils.ai_processor import AIProcessor, get_ai_processor
 from ..services.image_generator import image_generator
 
 router = APIRouter(prefix="/instagram", tags=["instagram"])
@@ -195,7 +195,8 @@ async def share_post(post_id: int, db: Session = Depends(get_db)):
 async def add_comment(
     post_id: int,
     comment_data: dict,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
 ):
     """Add AI-generated comment to a post"""
     try:
@@ -203,8 +204,6 @@ async def add_comment(
         if not resource:
             raise HTTPException(status_code=404, detail="Post not found")
         
-        # Generate AI response using the AI processor
-        ai_processor = AIProcessor()
         user_comment = comment_data.get('comment', '')
         
         # Generate AI response based on the article content
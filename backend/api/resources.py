@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
@@ -6,7 +7,7 @@ from datetime import datetime, timedelta
 
 from ..database.connection import get_db
 from ..models.resource import Resource
-from ..utils.ai_processor import AIProcessor
+from ..utils.ai_processor import AIProcessor, get_ai_processor
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -14,9 +15,6 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api", tags=["Resources"])
 
-# Initialize AI processor
-ai_processor = AIProcessor()
-
 @router.get("/articles", summary="Get Articles")
 def get_articles(
     search: Optional[str] = Query(None, description="Search query"),
@@ -181,9 +179,46 @@ def get_stats(db: Session = Depends(get_db)):
         logger.error(f"Error fetching stats: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Session queries are blocking, so the async AI endpoints run them in the threadpool
+def _get_active_article(db: Session, article_id: str) -> Optional[Resource]:
+    """Fetch one active article, or None if it does not exist."""
+    return db.query(Resource).filter(
+        Resource.resource_id == article_id,
+        Resource.status == 'active'
+    ).first()
+
+def _get_active_articles(db: Session, article_ids: List[str]) -> List[Resource]:
+    """Fetch the active articles among the given IDs."""
+    return db.query(Resource).filter(
+        Resource.resource_id.in_(article_ids),
+        Resource.status == 'active'
+    ).all()
+
+def _get_briefing_articles(db: Session) -> List[Resource]:
+    """Fetch today's top articles, falling back to yesterday's if there are none."""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    articles = db.query(Resource).filter(
+        Resource.status == 'active',
+        Resource.discovered_at >= today
+    ).order_by(Resource.relevance_score.desc()).limit(10).all()
+
+    if not articles:
+        # Fallback to recent articles if no articles today
+        yesterday = today - timedelta(days=1)
+        articles = db.query(Resource).filter(
+            Resource.status == 'active',
+            Resource.discovered_at >= yesterday
+        ).order_by(Resource.relevance_score.desc()).limit(10).all()
+    return articles
+
 # AI Chat Endpoints
 @router.post("/ai/chat", summary="Chat with AI about Articles")
-def chat_with_ai(chat_data: dict, db: Session = Depends(get_db)):
+async def chat_with_ai(
+    chat_data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Chat with AI about articles or general news topics.
     """
@@ -197,10 +232,7 @@ def chat_with_ai(chat_data: dict, db: Session = Depends(get_db)):
         # Get article context if provided
         article_context = ""
         if article_id:
-            article = db.query(Resource).filter(
-                Resource.resource_id == article_id,
-                Resource.status == 'active'
-            ).first()
+            article = await run_in_threadpool(_get_active_article, db, article_id)
 
             if article:
                 article_context = f"""
@@ -210,7 +242,7 @@ def chat_with_ai(chat_data: dict, db: Session = Depends(get_db)):
                 """
 
         # Generate AI response
-        response = ai_processor.chat_about_article(message, article_context)
+        response = await ai_processor.chat_about_article(message, article_context)
 
         if response:
             return {
@@ -228,7 +260,11 @@ def chat_with_ai(chat_data: dict, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/ai/summarize", summary="AI Summarize Article")
-def ai_summarize_article(data: dict, db: Session = Depends(get_db)):
+async def ai_summarize_article(
+    data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Generate AI summary for an article.
     """
@@ -240,16 +276,13 @@ def ai_summarize_article(data: dict, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="article_id is required")
 
         # Get article
-        article = db.query(Resource).filter(
-            Resource.resource_id == article_id,
-            Resource.status == 'active'
-        ).first()
+        article = await run_in_threadpool(_get_active_article, db, article_id)
 
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
 
         # Generate summary
-        summary = ai_processor.generate_summary(article.content, custom_length)
+        summary = await ai_processor.generate_summary(article.content, custom_length)
 
         if summary:
             return {
@@ -267,7 +300,11 @@ def ai_summarize_article(data: dict, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/ai/explain-relevance", summary="AI Explain Article Relevance")
-def ai_explain_relevance(data: dict, db: Session = Depends(get_db)):
+async def ai_explain_relevance(
+    data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Get AI explanation of why an article is relevant to user.
     """
@@ -279,17 +316,14 @@ def ai_explain_relevance(data: dict, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="article_id is required")
 
         # Get article
-        article = db.query(Resource).filter(
-            Resource.resource_id == article_id,
-            Resource.status == 'active'
-        ).first()
+        article = await run_in_threadpool(_get_active_article, db, article_id)
 
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
 
         # Generate relevance explanation
         article_dict = article.to_dict()
-        explanation = ai_processor.generate_relevance_explanation(article_dict, user_profile)
+        explanation = await ai_processor.generate_relevance_explanation(article_dict, user_profile)
 
         if explanation:
             return {
@@ -307,7 +341,11 @@ def ai_explain_relevance(data: dict, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/ai/daily-briefing", summary="Generate Daily News Briefing")
-def generate_daily_briefing(data: dict, db: Session = Depends(get_db)):
+async def generate_daily_briefing(
+    data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Generate a personalized daily news briefing.
     """
@@ -315,26 +353,12 @@ def generate_daily_briefing(data: dict, db: Session = Depends(get_db)):
         user_profile = data.get('user_profile', {})
 
         # Get today's top articles
-        from datetime import datetime, timedelta
-        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        articles = db.query(Resource).filter(
-            Resource.status == 'active',
-            Resource.discovered_at >= today
-        ).order_by(Resource.relevance_score.desc()).limit(10).all()
-
-        if not articles:
-            # Fallback to recent articles if no articles today
-            yesterday = today - timedelta(days=1)
-            articles = db.query(Resource).filter(
-                Resource.status == 'active',
-                Resource.discovered_at >= yesterday
-            ).order_by(Resource.relevance_score.desc()).limit(10).all()
+        articles = await run_in_threadpool(_get_briefing_articles, db)
 
         articles_data = [article.to_dict() for article in articles]
 
         # Generate briefing
-        briefing = ai_processor.generate_daily_briefing(articles_data, user_profile)
+        briefing = await ai_processor.generate_daily_briefing(articles_data, user_profile)
 
         if briefing:
             return {
@@ -352,7 +376,11 @@ def generate_daily_briefing(data: dict, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/ai/personalized-insights", summary="Get Personalized Article Insights")
-def get_personalized_insights(data: dict, db: Session = Depends(get_db)):
+async def get_personalized_insights(
+    data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Get personalized insights for articles based on user profile.
     """
@@ -364,15 +392,12 @@ def get_personalized_insights(data: dict, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="article_ids are required")
 
         # Get articles
-        articles = db.query(Resource).filter(
-            Resource.resource_id.in_(article_ids),
-            Resource.status == 'active'
-        ).all()
+        articles = await run_in_threadpool(_get_active_articles, db, article_ids)
 
         articles_data = [article.to_dict() for article in articles]
 
         # Generate personalized insights
-        enhanced_articles = ai_processor.generate_personalized_insights(articles_data, user_profile)
+        enhanced_articles = await ai_processor.generate_personalized_insights(articles_data, user_profile)
 
         return {
             "articles": enhanced_articles,
@@ -386,7 +411,11 @@ def get_personalized_insights(data: dict, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/ai/sentiment-analysis", summary="Analyze Article Sentiment")
-def analyze_article_sentiment(data: dict, db: Session = Depends(get_db)):
+async def analyze_article_sentiment(
+    data: dict,
+    db: Session = Depends(get_db),
+    ai_processor: AIProcessor = Depends(get_ai_processor)
+):
     """
     Analyze sentiment of an article.
     """
@@ -397,16 +426,13 @@ def analyze_article_sentiment(data: dict, db: Session = Depends(get_db)):
             raise HTTPException(status_code=400, detail="article_id is required")
 
         # Get article
-        article = db.query(Resource).filter(
-            Resource.resource_id == article_id,
-            Resource.status == 'active'
-        ).first()
+        article = await run_in_threadpool(_get_active_article, db, article_id)
 
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
 
         # Analyze sentiment
-        sentiment_analysis = ai_processor.analyze_sentiment(article.content)
+        sentiment_analysis = await ai_processor.analyze_sentiment(article.content)
 
         if sentiment_analysis:
             return {
@@ -22,8 +22,8 @@ if DATABASE_URL.startswith("postgresql"):
     engine = create_engine(
         DATABASE_URL,
         poolclass=QueuePool,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=20,
+        max_overflow=40,
         pool_pre_ping=True,
         pool_recycle=300,  # Recycle connections every 5 minutes
         echo=False  # Set to True for SQL debugging
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import logging
@@ -6,6 +6,8 @@ import os
 
 from backend.api import resources, instagram
 from backend.database.connection import init_db, check_db_connection
+from backend.services.image_generator import image_generator
+from backend.utils.ai_processor import close_http_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -50,10 +52,18 @@ def health_check():
 app.include_router(resources.router)
 app.include_router(instagram.router)
 
-# Mount static files for images
-os.makedirs("data/images", exist_ok=True)
-os.makedirs("data/placeholders", exist_ok=True)
+# Mount static files for images (image_generator created the directories on import)
 app.mount("/images", StaticFiles(directory="data/images"), name="images")
+
+# Placeholders are served from memory; registered before the mount so it takes precedence
+@app.get("/placeholders/{filename}", tags=["Images"], include_in_schema=False)
+def get_placeholder(filename: str):
+    category, ext = os.path.splitext(filename)
+    data = image_generator.get_placeholder_bytes(category) if ext == ".jpg" else None
+    if data is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return Response(content=data, media_type="image/jpeg")
+
 app.mount("/placeholders", StaticFiles(directory="data/placeholders"), name="placeholders")
 
 # --- Application Startup --- #
@@ -74,6 +84,14 @@ async def on_startup():
     else:
         logging.error("Database connection failed")
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    logging.info("FastAPI application shutting down...")
+    
+    # Close pooled HTTP connections
+    await image_generator.close()
+    await close_http_client()
+
 
 # To run this application:
 # uvicorn backend.main:app --reload
@@ -1,12 +1,12 @@
-import asyncio
 import argparse
+import logging
 import sys
 import os
 
 # Add the project root to the Python path to resolve import issues
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from backend.scrapers.async_pipeline import run_async_pipeline
+from backend.scrapers.async_pipeline import run_pipeline
 
 def main():
     """
@@ -17,12 +17,14 @@ def main():
     parser.add_argument(
         '--workers',
         type=int,
-        default=10,
-        help='The maximum number of concurrent workers for scraping.'
+        default=int(os.getenv('SCRAPER_WORKERS', '10')),
+        help='The maximum number of concurrent workers for scraping (default: $SCRAPER_WORKERS or 10).'
     )
     args = parser.parse_args()
 
-    asyncio.run(run_async_pipeline(max_workers=args.workers))
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    run_pipeline(max_workers=args.workers)
 
 if __name__ == "__main__":
     main()
@@ -1,22 +1,65 @@
 import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 import logging
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from backend.scrapers.sites.channelnewsasia.discoverer import discover_links as cna_discoverer
+from backend.scrapers.sites.channelnewsasia.discoverer import discover_links as cna_discoverer, fetch_page as fetch_cna_page
+from backend.scrapers.parse_pool import parse_many, shutdown_pool
 from backend.scrapers.resource_extractor import extract_resource_content
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional, and unavailable on Windows
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+# Limits for concurrent category page fetches during discovery
+DISCOVERY_CONNECTION_LIMIT = 20
+DISCOVERY_CONCURRENCY = 15
+# Category pages change slowly, so repeat runs within this window are served
+# from the on-disk cache instead of the network. Expired entries are dropped
+# and fetched again in full; aiohttp-client-cache does not revalidate them
+# with conditional requests.
+DISCOVERY_CACHE_PATH = 'data/http_cache'
+DISCOVERY_CACHE_TTL = 600
+
+async def discover_all_links(source_urls: list) -> set:
+    """
+    Fetches all category pages concurrently over one shared session, parses
+    them across CPU cores, and returns the union of the resource links found.
+    """
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=DISCOVERY_CONNECTION_LIMIT, keepalive_timeout=30)
+    cache = SQLiteBackend(DISCOVERY_CACHE_PATH, expire_after=DISCOVERY_CACHE_TTL, cache_control=True)
+
+    async with CachedSession(cache=cache, connector=connector) as session:
+        async def fetch(url: str):
+            async with semaphore:
+                return await fetch_cna_page(url, session)
+
+        pages = await asyncio.gather(*(fetch(url) for url in source_urls))
+
+    # Parsing is CPU-bound, so run it in the process pool, off the event loop
+    bodies = [page for page in pages if page]
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(None, parse_many, cna_discoverer, bodies)
+
+    links = set()
+    for page_links in results:
+        links.update(page_links)
+    return links
 
 async def scrape_and_prepare_resource(url: str):
     """
     Asynchronously scrapes a single URL and prepares the resource data dictionary.
     Does not insert into the database.
     """
-    logging.info(f"Scraping: {url}")
+    logger.info(f"Scraping: {url}")
     loop = asyncio.get_event_loop()
     
     try:
@@ -38,21 +81,34 @@ async def scrape_and_prepare_resource(url: str):
                 'summary': 'N/A',
                 'status': 'active'
             }
-            logging.info(f"Successfully scraped: {resource_content.get('title')}")
+            logger.info(f"Successfully scraped: {resource_content.get('title')}")
             return resource_data
         else:
-            logging.warning(f"Could not extract content from: {url}")
+            logger.warning(f"Could not extract content from: {url}")
             return None
     except Exception as e:
-        logging.error(f"Error scraping {url}: {e}")
+        logger.error(f"Error scraping {url}: {e}")
         return None
 
+def run_pipeline(max_workers: int):
+    """
+    Runs the pipeline to completion on a fresh event loop, using uvloop's
+    faster socket handling where it is installed. The parsing pool's worker
+    processes are shut down once it finishes.
+    """
+    try:
+        if uvloop is not None:
+            return uvloop.run(run_async_pipeline(max_workers=max_workers))
+        return asyncio.run(run_async_pipeline(max_workers=max_workers))
+    finally:
+        shutdown_pool()
+
 async def run_async_pipeline(max_workers: int):
     """
     Runs the full scraping pipeline asynchronously using a specified number of workers.
     """
     start_time = time.time()
-    logging.info(f"Starting asynchronous pipeline with {max_workers} workers...")
+    logger.info(f"Starting asynchronous pipeline with {max_workers} workers...")
 
     # Discover links from multiple categories (example, should be modularized)
     source_urls = [
@@ -61,17 +117,14 @@ async def run_async_pipeline(max_workers: int):
         'https://www.channelnewsasia.com/sport'
     ]
 
-    all_discovered_links = set()
-    logging.info(f"Discovering links from {len(source_urls)} categories...")
-    for url in source_urls:
-        discovered = cna_discoverer(url)
-        all_discovered_links.update(discovered)
+    logger.info(f"Discovering links from {len(source_urls)} categories...")
+    all_discovered_links = await discover_all_links(source_urls)
     
     new_links = list(all_discovered_links)
-    logging.info(f"Discovered {len(new_links)} new resources to process.")
+    logger.info(f"Discovered {len(new_links)} new resources to process.")
 
     if not new_links:
-        logging.info("No new resources to process. Pipeline finished.")
+        logger.info("No new resources to process. Pipeline finished.")
         return
 
     # Set up the thread pool executor
@@ -79,7 +132,7 @@ async def run_async_pipeline(max_workers: int):
     loop.set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
 
     # Stage 1: Concurrently scrape all new links
-    logging.info("--- Stage 1: Scraping all new resources ---")
+    logger.info("--- Stage 1: Scraping all new resources ---")
     tasks = [scrape_and_prepare_resource(link) for link in new_links]
     scraped_resources = await asyncio.gather(*tasks)
     
@@ -88,14 +141,14 @@ async def run_async_pipeline(max_workers: int):
     
     resources_processed = len(valid_resources)
     if resources_processed == 0:
-        logging.info("No new resources were successfully scraped. Pipeline finished.")
+        logger.info("No new resources were successfully scraped. Pipeline finished.")
         return
 
     scraping_duration = time.time() - start_time
-    logging.info(f"--- Stage 1 finished in {scraping_duration:.2f} seconds. Scraped {resources_processed} resources. ---")
+    logger.info(f"--- Stage 1 finished in {scraping_duration:.2f} seconds. Scraped {resources_processed} resources. ---")
 
     # TODO: Insert valid_resources into the PostgreSQL database here
     # (This should be implemented in the next step)
 
     total_duration = time.time() - start_time
-    logging.info(f"--- Pipeline finished. Total duration: {total_duration:.2f} seconds. ---")
+    logger.info(f"--- Pipeline finished. Total duration: {total_duration:.2f} seconds. ---")
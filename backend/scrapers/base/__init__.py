@@ -1,3 +1,3 @@
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, ExtractedContent
 
-__all__ = ['BaseCrawler'] 
\ No newline at end of file
+__all__ = ['BaseCrawler', 'ExtractedContent']
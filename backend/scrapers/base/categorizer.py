@@ -0,0 +1,72 @@
+"""Keyword-based article categorization shared by the site crawlers.
+
+Each site registers a ``{category: keywords}`` table for its URLs and one for
+its content. Each table is compiled once into a single case-insensitive
+alternation with a named group per category, so one scan finds the first
+keyword and ``lastgroup`` names its category. Category names are interned so
+every article shares one string object per category, whichever regex
+engine produced it.
+"""
+import re
+import string
+import sys
+from typing import Dict, List, Tuple
+
+from .re2_compat import compile_pattern
+
+# Category signal is dense near the top of an article, so content scans stop here
+CATEGORY_SCAN_CHARS = 8192
+
+_SITE_RES: Dict[str, Tuple] = {}
+
+# Punctuation becomes a word break, so 'market,' and '(market)' tokenize as 'market'
+_PUNCT_TO_SPACE = str.maketrans(dict.fromkeys(string.punctuation, ' '))
+
+
+def _alternation(table: Dict[str, List[str]]):
+    return compile_pattern('|'.join(
+        f"(?P<{category}>{'|'.join(map(re.escape, words))})" for category, words in table.items()
+    ), re.IGNORECASE)
+
+
+def register(site: str, url_table: Dict[str, List[str]], content_table: Dict[str, List[str]]) -> None:
+    """Compile and register a site's URL and content keyword tables."""
+    _SITE_RES[site] = (_alternation(url_table), _alternation(content_table))
+
+
+def categorize(site: str, url: str, content: str) -> str:
+    """Categorize an article by its URL first, then by the head of its content."""
+    url_re, content_re = _SITE_RES[site]
+    match = url_re.search(url) or content_re.search(content, 0, CATEGORY_SCAN_CHARS)
+    return sys.intern(match.lastgroup) if match else 'general'
+
+
+def compile_url_table(url_cats: Tuple):
+    """Compile ``(substring, category)`` pairs into one URL alternation.
+
+    Returns None for an empty table, which would otherwise match everywhere.
+    """
+    table: Dict[str, List[str]] = {}
+    for keyword, category in url_cats:
+        table.setdefault(category, []).append(keyword)
+    return _alternation(table) if table else None
+
+
+def categorize_by_tables(url: str, content_lower: str, url_re, content_cats: Tuple) -> str:
+    """Categorize by URL keywords first, then by whole words of the content.
+
+    ``url_re`` comes from :func:`compile_url_table`, so all URL keywords are
+    found in one case-insensitive scan. ``content_cats`` is a tuple of
+    ``(category, frozenset(words))`` pairs, and the first category sharing a
+    word with the content wins. The already-lowercased content is tokenized
+    once, so each category costs one set operation.
+    """
+    if url_re is not None:
+        match = url_re.search(url)
+        if match:
+            return sys.intern(match.lastgroup)
+    tokens = set(content_lower.translate(_PUNCT_TO_SPACE).split())
+    for category, keywords in content_cats:
+        if not keywords.isdisjoint(tokens):
+            return category
+    return 'general'
@@ -0,0 +1,31 @@
+import re
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - wheel unavailable on this platform
+    re2 = None
+
+# RE2 takes flags inline rather than as a bitmask
+_INLINE_FLAGS = {
+    re.IGNORECASE: 'i',
+    re.DOTALL: 's',
+    re.MULTILINE: 'm',
+}
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when available, falling back to the stdlib.
+
+    RE2 matches in time linear in the input, so the lazy ``.*?\\]`` cleanup
+    patterns can't backtrack quadratically on markdown with no closing
+    bracket. Patterns RE2 rejects (backreferences, lookaround) are compiled
+    with ``re`` instead. Both engines expose the same ``sub``/``search``/
+    ``finditer`` interface for the uses in this package.
+    """
+    if re2 is not None:
+        inline = ''.join(letter for flag, letter in _INLINE_FLAGS.items() if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
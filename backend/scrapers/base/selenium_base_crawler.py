@@ -2,8 +2,19 @@ import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+import re
 from bs4 import BeautifulSoup
 
+# Common noise words, compiled once at import into a single alternation
+_NOISE_PATTERNS = [
+    r'cookie|privacy|terms|subscribe|sign up|sign in|advertisement|ad',
+    r'feedback|survey|rate this|how relevant',
+    r'skip to|navigation|menu|search',
+    r'loading|please wait|detecting',
+    r'robot|captcha|verification'
+]
+_NOISE_RE = re.compile('|'.join(_NOISE_PATTERNS), re.IGNORECASE)
+
 class SeleniumBaseCrawler:
     def __init__(self, headless=True):
         options = Options()
@@ -53,24 +64,10 @@ class SeleniumBaseCrawler:
             return ""
         
         # Remove common noise patterns
-        noise_patterns = [
-            r'cookie|privacy|terms|subscribe|sign up|sign in|advertisement|ad',
-            r'feedback|survey|rate this|how relevant',
-            r'skip to|navigation|menu|search',
-            r'loading|please wait|detecting',
-            r'robot|captcha|verification'
-        ]
-        
-        import re
-        cleaned = content
-        for pattern in noise_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
+        cleaned = _NOISE_RE.sub('', content)
         
-        return cleaned
+        # Collapse whitespace and trim in one C-level split/join pass
+        return ' '.join(cleaned.split())
 
     def close(self):
         self.driver.quit() 
\ No newline at end of file
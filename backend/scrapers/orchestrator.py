@@ -1,5 +1,7 @@
 import asyncio
-from typing import Dict, List, Optional, Any
+import re
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from .sites.wsj.crawler import WSJCrawler
 from .sites.ft.crawler import FTCrawler
@@ -22,6 +24,21 @@ from .sites.shopify.selenium_crawler import ShopifySeleniumCrawler
 from .sites.invesco.selenium_crawler import InvescoSeleniumCrawler
 from .sites.ft.selenium_crawler import FTSeleniumCrawler
 
+
+# Host prefixes that share a crawler with the bare domain, e.g. edition.cnn.com -> cnn.com.
+# Same as removing one 'www.' and then one 'edition.'; other subdomains are kept.
+# amp. and m. hosts serve different markup than the site crawlers parse, so they
+# are not mapped onto the bare domain.
+_DOMAIN_STRIP = re.compile(r'^(?:www\.)?(?:edition\.)?')
+
+
+@lru_cache(maxsize=8192)
+def _split_domain(url: str) -> Tuple[str, str]:
+    """Parse a URL once, returning its raw netloc and the crawler lookup domain."""
+    netloc = urlparse(url).netloc
+    return netloc, _DOMAIN_STRIP.sub('', netloc, count=1)
+
+
 class CrawlerOrchestrator:
     """Orchestrates multiple crawlers and manages the crawling process."""
     
@@ -53,28 +70,19 @@ class CrawlerOrchestrator:
         
     def get_crawler_for_url(self, url: str):
         """Get the appropriate crawler for a given URL."""
-        domain = urlparse(url).netloc
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
-        # Handle subdomains like edition.cnn.com -> cnn.com
-        if domain.startswith('edition.'):
-            domain = domain.replace('edition.', '')
-        
-        return self.crawlers.get(domain)
+        return self.crawlers.get(self._get_domain_from_url(url))
     
     async def crawl_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Crawl a single URL using the appropriate crawler with Selenium fallback."""
-        domain = self._get_domain_from_url(url)
-        crawler = self.get_crawler_for_url(url)
+        netloc, domain = _split_domain(url)
+        crawler = self.crawlers.get(domain)
         
         if not crawler:
-            print(f"No crawler found for domain: {urlparse(url).netloc}")
+            print(f"No crawler found for domain: {netloc}")
             return None
         
         # Try Crawl4AI first
-        result = await crawler.crawl_url(url)
+        result = await crawler.crawl_url(url, netloc=netloc)
         
         # If Crawl4AI fails and we have a Selenium fallback, try that
         if result is None and domain in self.selenium_crawlers:
@@ -94,14 +102,7 @@ class CrawlerOrchestrator:
     
     def _get_domain_from_url(self, url: str) -> str:
         """Extract domain from URL for fallback logic."""
-        domain = urlparse(url).netloc
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        # Handle subdomains like edition.cnn.com -> cnn.com
-        if domain.startswith('edition.'):
-            domain = domain.replace('edition.', '')
-        return domain
+        return _split_domain(url)[1]
     
     def _convert_selenium_result(self, selenium_result: Dict[str, Any], domain: str) -> Dict[str, Any]:
         """Convert Selenium result to match Crawl4AI format."""
@@ -132,30 +133,40 @@ class CrawlerOrchestrator:
             'status': 'active',
             'metadata_json': {
                 'source_domain': domain,
-                'section': '',
-                'author': '',
                 'word_count': word_count,
                 'quality_score': quality_score,
                 'extraction_method': 'selenium',
-                'crawled_at': datetime.utcnow()
+                'crawled_at': datetime.utcnow().isoformat()
             }
         }
     
-    async def crawl_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Crawl multiple URLs concurrently."""
-        tasks = []
-        for url in urls:
-            task = asyncio.create_task(self.crawl_url(url))
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def crawl_urls(
+        self,
+        urls: List[str],
+        sink: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Crawl multiple URLs concurrently.
+        
+        Results are handled as each URL finishes rather than after the whole
+        batch. When a ``sink`` is given, every successful result is awaited into
+        it immediately and nothing is retained, so the returned list is empty.
+        """
+        tasks = [asyncio.create_task(self.crawl_url(url)) for url in urls]
         
         # Filter out None results and exceptions
         valid_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                print(f"Error during crawling: {result}")
-            elif result is not None:
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                result = await next_result
+            except Exception as e:
+                print(f"Error during crawling: {e}")
+                continue
+            
+            if result is None:
+                continue
+            if sink is not None:
+                await sink(result)
+            else:
                 valid_results.append(result)
         
         return valid_results
@@ -0,0 +1,50 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional
+
+# Shared pool for CPU-bound HTML parsing. Created on first use so importing
+# this module (including in the worker processes themselves) stays cheap.
+_POOL: Optional[ProcessPoolExecutor] = None
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    Returns the shared parsing pool, starting it on first use.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+# Below this many pages, the IPC and worker start-up cost more than the
+# parsing saves, so they are parsed in the calling thread
+INLINE_PARSE_LIMIT = 4
+
+def parse_many(parse_func: Callable, html_bodies: Iterable, chunksize: Optional[int] = None) -> List:
+    """
+    Runs a pure parsing function over many HTML bodies across all CPU cores.
+
+    Args:
+        parse_func: A picklable module-level function of one HTML body,
+            such as a site's discover_links or parse.
+        html_bodies: The pages to parse.
+        chunksize: Pages sent to a worker per round trip. Defaults to about
+            four chunks per core, so small batches still spread across workers.
+
+    Returns:
+        The parse results, in the same order as html_bodies.
+    """
+    html_bodies = list(html_bodies)
+    if len(html_bodies) < INLINE_PARSE_LIMIT:
+        return [parse_func(html) for html in html_bodies]
+    if chunksize is None:
+        chunksize = max(1, len(html_bodies) // ((os.cpu_count() or 1) * 4))
+    return list(get_pool().map(parse_func, html_bodies, chunksize=chunksize))
+
+def shutdown_pool():
+    """
+    Shuts down the shared parsing pool if it was started.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown()
+        _POOL = None
@@ -1,17 +1,27 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
 from newspaper import Article
 import trafilatura
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Shared session so repeat requests to the same site reuse pooled keep-alive
+# connections instead of paying DNS + TCP + TLS setup on every URL
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=2)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
 
 def extract_resource_content(url: str) -> dict:
     """
     Extracts resource content using Trafilatura for the main text and 
-    Newspaper3k for metadata. It uses the requests library with a User-Agent
-    to avoid being blocked.
+    Newspaper3k for metadata. It uses a shared requests session with a
+    User-Agent to avoid being blocked.
 
     Args:
         url: The URL of the resource to process.
@@ -20,28 +30,25 @@ def extract_resource_content(url: str) -> dict:
         A dictionary containing the resource's title, text, publish date, 
         and content hash, or None if extraction fails.
     """
-    logging.info(f"Processing URL: {url}")
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
+    logger.info(f"Processing URL: {url}")
+
     try:
         # Fetch the page content using requests to handle potential blocks
-        response = requests.get(url, headers=headers, timeout=20)
+        response = _SESSION.get(url, timeout=20)
         response.raise_for_status()
         downloaded_html = response.text
 
         if not downloaded_html:
-            logging.error(f"Failed to fetch URL content for {url}.")
+            logger.error(f"Failed to fetch URL content for {url}.")
             return None
 
         # 1. Use Trafilatura to get the main body of the resource
         content = trafilatura.extract(downloaded_html, include_comments=False, include_tables=False)
         if not content or len(content) < 100:
-            logging.error(f"Trafilatura failed to extract sufficient content from {url}.")
+            logger.error(f"Trafilatura failed to extract sufficient content from {url}.")
             return None
         
-        logging.info(f"Successfully extracted content from {url} using Trafilatura.")
+        logger.info(f"Successfully extracted content from {url} using Trafilatura.")
         content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
 
         # 2. Use Newspaper3k on the same HTML to extract metadata
@@ -57,13 +64,14 @@ def extract_resource_content(url: str) -> dict:
         }
 
     except requests.RequestException as e:
-        logging.error(f"Failed to fetch {url} with requests: {e}")
+        logger.error(f"Failed to fetch {url} with requests: {e}")
         return None
     except Exception as e:
-        logging.error(f"An unexpected error occurred while processing {url}: {e}")
+        logger.error(f"An unexpected error occurred while processing {url}: {e}")
         return None
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     # Add test URLs here
     test_urls = [
         "https://www.channelnewsasia.com/singapore/work-permit-no-maximum-employment-period-age-s-pass-foreign-workers-4981096", # New valid CNA link
@@ -0,0 +1,95 @@
+import sys
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+from ..base import BaseCrawler, ExtractedContent
+from ..base.categorizer import categorize_by_tables, compile_url_table
+
+
+@lru_cache(maxsize=8192)
+def section_from_url(url: str) -> str:
+    """Return the first path segment of url; retries and dedup passes revisit URLs.
+
+    Slices the segment out with str.find rather than building a urlparse
+    result and splitting the whole path.
+    """
+    scheme = url.find('://')
+    slash = url.find('/', scheme + 3) if scheme >= 0 else url.find('/')
+    if slash < 0:
+        return 'general'
+    start = slash + 1
+    end = len(url)
+    # The segment ends at the next '/', or where the query or fragment begins
+    for sep in '/?#':
+        pos = url.find(sep, start, end)
+        if pos >= 0:
+            end = pos
+    # Sections repeat across articles, so share one string object per section
+    return sys.intern(url[start:end]) or 'general'
+
+
+class MarkdownSiteCrawler(BaseCrawler):
+    """Crawler for sites that only need boilerplate cleaning, keyword-table
+    categorization and a section taken from the first URL path segment.
+
+    Subclasses set the class attributes below plus ``__init__`` (rate limit)
+    and ``get_site_config``.
+    """
+    
+    # Site cleaner (wrap in staticmethod); None uses BaseCrawler._clean_content
+    CLEANER: Optional[Callable[[str], str]] = None
+    # URL keywords (earliest match wins), then content words (first category wins)
+    _URL_CATS: tuple = ()
+    _CONTENT_CATS: tuple = ()
+    # _URL_CATS compiled into one alternation for each subclass
+    _URL_CAT_RE = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._URL_CAT_RE = compile_url_table(cls._URL_CATS)
+    
+    def extract_content(self, result) -> Optional[ExtractedContent]:
+        """Extract cleaned content and section from a crawl result.
+
+        Category is left to BaseCrawler.crawl_url, which lowercases the final
+        content once and shares it with quality scoring.
+        """
+        return self.extract_content_batch([result])[0]
+    
+    def extract_content_batch(self, results: List[Any]) -> List[Optional[ExtractedContent]]:
+        """Extract content from many crawl results in one pass.
+
+        Returns one entry per result, in order, exactly as extract_content
+        would (None for results without content or too short to be an
+        article). Method and attribute lookups are done once per batch
+        instead of once per result.
+        """
+        passage_and_url = self._passage_and_url
+        extract_metadata = self._extract_metadata
+        clean = self.CLEANER or self._clean_content
+        min_chars = self._min_passage_chars
+        
+        extracted = []
+        append = extracted.append
+        for result in results:
+            passage, url = passage_and_url(result)
+            if not passage or len(passage) < min_chars:
+                append(None)
+                continue
+            metadata = extract_metadata(result)
+            append(ExtractedContent(
+                content=clean(passage),
+                title=metadata.get('title', ''),
+                summary=metadata.get('summary', ''),
+                published_at=metadata.get('published_at'),
+                author=metadata.get('author', ''),
+                section=section_from_url(url)
+            ))
+        return extracted
+    
+    def _determine_category(self, url: str, content_lower: str) -> str:
+        """Determine content category from the site's keyword tables."""
+        return categorize_by_tables(url, content_lower, self._URL_CAT_RE, self._CONTENT_CATS)
+    
+    def _extract_section_from_url(self, url: str) -> str:
+        """Extract the section from the first URL path segment."""
+        return section_from_url(url)
@@ -1,11 +1,63 @@
 import re
-from typing import Dict, Any
-from urllib.parse import urlparse
-from ...base import BaseCrawler
+from typing import Dict, Any, Optional
+from ...base import BaseCrawler, ExtractedContent
+from ...base.categorizer import categorize, register
+from ...base.re2_compat import compile_pattern
+from .._common import section_from_url
+
+# Category keywords for URLs, then for the head of the content
+register('bloomberg', {
+    'markets': ['markets', 'stocks'],
+    'business': ['business', 'companies'],
+    'technology': ['technology', 'tech'],
+    'politics': ['politics', 'government'],
+    'economics': ['economics', 'economy'],
+}, {
+    'markets': ['market', 'trading', 'investor', 'stock', 'bond'],
+    'business': ['company', 'corporate', 'earnings', 'revenue'],
+    'technology': ['technology', 'software', 'digital', 'innovation'],
+    'politics': ['government', 'policy', 'regulation', 'law'],
+    'economics': ['economy', 'economic', 'gdp', 'inflation'],
+})
+
 
 class BloombergCrawler(BaseCrawler):
     """Bloomberg crawler with financial news focus."""
     
+    # Sentences of 50+ characters, and the navigation words that disqualify them
+    _SENTENCE_RE = re.compile(r'[^.!?]{50,}[.!?]')
+    _NAV_RE = re.compile(r'menu|navigation|skip|subscribe|sign in', re.IGNORECASE)
+    
+    # Bloomberg boilerplate (more aggressive than other sites), compiled once
+    # at import into a single alternation
+    _CLEAN_PATTERNS = [
+        r'Your browser is.*?Try a different browser.*?Learn more',
+        r'Your browser is.*?Learn more.*?\]',
+        r'This browser is out of date.*?\]',
+        r'Learn more.*?\]',
+        r'Bloomberg.*?\]',
+        r'Subscribe.*?\]',
+        r'Sign in.*?\]',
+        r'Markets.*?\]',
+        r'Technology.*?\]',
+        r'Politics.*?\]',
+        r'Business.*?\]',
+        r'Opinion.*?\]',
+        r'Pursuits.*?\]',
+        r'Green.*?\]',
+        r'CityLab.*?\]',
+        r'Hyperdrive.*?\]',
+        r'Skip Navigation.*?\]',
+        r'Skip to content.*?\]',
+        r'Skip to main content.*?\]',
+        r'Navigation.*?\]',
+        r'Menu.*?\]',
+        r'Search.*?\]',
+        r'Log in.*?\]',
+        r'Register.*?\]',
+    ]
+    _CLEAN_RE = compile_pattern('|'.join(f'(?:{p})' for p in _CLEAN_PATTERNS), re.IGNORECASE | re.DOTALL)
+    
     def __init__(self):
         super().__init__(rate_limit=1.0)  # Conservative rate limiting
     
@@ -19,12 +71,12 @@ class BloombergCrawler(BaseCrawler):
             }
         }
     
-    def extract_content(self, result) -> Dict[str, Any]:
+    def extract_content(self, result) -> Optional[ExtractedContent]:
         """Extract content from Bloomberg pages."""
         # Get raw content
-        passage = getattr(result, 'markdown', None) or getattr(result, 'extracted_content', None)
-        if not passage:
-            return {}
+        passage, url = self._passage_and_url(result)
+        if not passage or len(passage) < self._min_passage_chars:
+            return None
         
         # Extract metadata
         metadata = self._extract_metadata(result)
@@ -32,122 +84,45 @@ class BloombergCrawler(BaseCrawler):
         # Clean content - Bloomberg has specific patterns
         cleaned_content = self._clean_bloomberg_content(passage)
         
-        # Determine category from URL or content
-        url = getattr(result, 'url', '')
-        category = self._determine_category(url, cleaned_content)
+        # Category is determined later in crawl_url, which shares the
+        # lowercased content with quality scoring
         
         # Extract section from URL
         section = self._extract_section_from_url(url)
         
-        return {
-            'content': cleaned_content,
-            'title': metadata.get('title', ''),
-            'summary': metadata.get('summary', ''),
-            'published_at': metadata.get('published_at'),
-            'author': metadata.get('author', ''),
-            'category': category,
-            'section': section
-        }
+        return ExtractedContent(
+            content=cleaned_content,
+            title=metadata.get('title', ''),
+            summary=metadata.get('summary', ''),
+            published_at=metadata.get('published_at'),
+            author=metadata.get('author', ''),
+            section=section
+        )
     
     def _clean_bloomberg_content(self, content: str) -> str:
         """Clean Bloomberg-specific content patterns."""
         if not content:
             return ""
         
-        # Bloomberg-specific patterns - more aggressive cleaning
-        bloomberg_patterns = [
-            r'Your browser is.*?Try a different browser.*?Learn more',
-            r'Your browser is.*?Learn more.*?\]',
-            r'This browser is out of date.*?\]',
-            r'Learn more.*?\]',
-            r'Bloomberg.*?\]',
-            r'Subscribe.*?\]',
-            r'Sign in.*?\]',
-            r'Markets.*?\]',
-            r'Technology.*?\]',
-            r'Politics.*?\]',
-            r'Business.*?\]',
-            r'Opinion.*?\]',
-            r'Pursuits.*?\]',
-            r'Green.*?\]',
-            r'CityLab.*?\]',
-            r'Hyperdrive.*?\]',
-            r'Skip Navigation.*?\]',
-            r'Skip to content.*?\]',
-            r'Skip to main content.*?\]',
-            r'Navigation.*?\]',
-            r'Menu.*?\]',
-            r'Search.*?\]',
-            r'Log in.*?\]',
-            r'Register.*?\]',
-        ]
+        cleaned = self._CLEAN_RE.sub('', content)
         
-        cleaned = content
-        for pattern in bloomberg_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove excessive whitespace and empty lines
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'^\s*$\n', '', cleaned, flags=re.MULTILINE)
-        cleaned = cleaned.strip()
-        
-        # If content is still too long with mostly navigation, try to extract main content
+        # If content is still too long with mostly navigation, keep only the
+        # substantial sentences. This must run before whitespace is collapsed.
         if len(cleaned) > 10000:
-            # Try to find the main content section
-            lines = cleaned.split('\n')
-            main_content_lines = []
-            in_main_content = False
-            
-            for line in lines:
-                line = line.strip()
-                if len(line) > 50 and not any(nav in line.lower() for nav in ['menu', 'navigation', 'skip', 'subscribe', 'sign in']):
-                    main_content_lines.append(line)
-            
-            if main_content_lines:
-                cleaned = ' '.join(main_content_lines)
+            main_content = ' '.join(
+                sentence for sentence in (m.group(0).strip() for m in self._SENTENCE_RE.finditer(cleaned))
+                if not self._NAV_RE.search(sentence)
+            )
+            if main_content:
+                cleaned = main_content
         
-        return cleaned
+        # Collapse whitespace and trim in one C-level split/join pass
+        return ' '.join(cleaned.split())
     
-    def _determine_category(self, url: str, content: str) -> str:
-        """Determine content category based on URL and content."""
-        url_lower = url.lower()
-        content_lower = content.lower()
-        
-        # URL-based categorization
-        if 'markets' in url_lower or 'stocks' in url_lower:
-            return 'markets'
-        elif 'business' in url_lower or 'companies' in url_lower:
-            return 'business'
-        elif 'technology' in url_lower or 'tech' in url_lower:
-            return 'technology'
-        elif 'politics' in url_lower or 'government' in url_lower:
-            return 'politics'
-        elif 'economics' in url_lower or 'economy' in url_lower:
-            return 'economics'
-        
-        # Content-based categorization
-        if any(word in content_lower for word in ['market', 'trading', 'investor', 'stock', 'bond']):
-            return 'markets'
-        elif any(word in content_lower for word in ['company', 'corporate', 'earnings', 'revenue']):
-            return 'business'
-        elif any(word in content_lower for word in ['technology', 'software', 'digital', 'innovation']):
-            return 'technology'
-        elif any(word in content_lower for word in ['government', 'policy', 'regulation', 'law']):
-            return 'politics'
-        elif any(word in content_lower for word in ['economy', 'economic', 'gdp', 'inflation']):
-            return 'economics'
-        
-        return 'general'
+    def _determine_category(self, url: str, content_lower: str) -> str:
+        """Determine content category based on the URL and lowercased content."""
+        return categorize('bloomberg', url, content_lower)
     
     def _extract_section_from_url(self, url: str) -> str:
         """Extract section from Bloomberg URL."""
-        try:
-            path = urlparse(url).path
-            if path.startswith('/'):
-                path = path[1:]
-            sections = path.split('/')
-            if sections:
-                return sections[0]
-        except:
-            pass
-        return 'general' 
\ No newline at end of file
+        return section_from_url(url)
\ No newline at end of file
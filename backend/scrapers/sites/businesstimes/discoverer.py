@@ -1,36 +1,89 @@
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
+import aiohttp
+from selectolax.parser import HTMLParser
 import logging
+import xxhash
+from typing import Optional, Union
+import re
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-def discover_links(html_content: str, base_url: str = "https://www.businesstimes.com.sg") -> list:
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+def _is_relative(href: str) -> bool:
+    # Same as startswith('/') and not startswith('//'), as plain index checks
+    return len(href) > 1 and href[0] == '/' and href[1] != '/'
+
+# Path segments that mark a link as a resource rather than navigation
+_BT_RESOURCE_RE = re.compile(r'/(?:resource|news|opinion)/')
+
+def discover_links(html_content: Union[str, bytes], base_url: str = "https://www.businesstimes.com.sg") -> list:
     """
     Discovers all resource links from a Business Times page.
 
     Args:
-        html_content: The HTML content of the page as a string.
+        html_content: The HTML content of the page, as a string or raw bytes.
         base_url: The base URL to resolve relative links.
 
     Returns:
         A list of unique, absolute URLs to resources found on the page.
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    links = set()
-
-    # Find all headline tags (h1, h3) which commonly contain resource links.
-    for tag in soup.find_all(['h1', 'h3']):
-        a_tag = tag.find('a', href=True)
-        if a_tag:
-            href = a_tag['href']
-            # Make sure it's a relative link to a resource
-            if href.startswith('/') and not href.startswith('//'):
-                full_url = urljoin(base_url, href)
-                # Filter out non-resource links based on URL patterns
-                if '/resource/' in href or '/news/' in href or '/opinion/' in href:
-                    links.add(full_url)
-
-    logging.info(f"Discovered {len(links)} unique resource links from {base_url}.")
-    return list(links)
+    tree = HTMLParser(html_content)
+    # Dedupe on 64-bit digests; keep the URLs in discovery order
+    seen = set()
+    links = []
+    # Hrefs are checked to be root-relative, so joining is plain concatenation
+    root = base_url.rstrip('/')
+
+    # Find links inside headline tags (h1, h3), which commonly contain resource links.
+    for a_tag in tree.css('h1 a[href], h3 a[href]'):
+        href = a_tag.attributes.get('href') or ''
+        # Make sure it's a relative link to a resource, filtering out
+        # non-resource links before building the absolute URL
+        if _is_relative(href) and _BT_RESOURCE_RE.search(href):
+            full_url = root + href
+            digest = xxhash.xxh3_64_intdigest(full_url)
+            if digest not in seen:
+                seen.add(digest)
+                links.append(full_url)
+
+    logger.info(f"Discovered {len(links)} unique resource links from {base_url}.")
+    return links
+
+async def fetch_page(url: str, session: aiohttp.ClientSession) -> Optional[bytes]:
+    """
+    Fetches a Business Times page with a shared aiohttp session.
+
+    Args:
+        url: The URL of the page to fetch.
+        session: The aiohttp session shared by all concurrent fetches.
+
+    Returns:
+        The raw HTML bytes of the page, or None if it could not be fetched.
+        The bytes go straight to the parser, which detects the encoding itself.
+    """
+    try:
+        async with session.get(url, timeout=FETCH_TIMEOUT, headers=HEADERS) as response:
+            response.raise_for_status()
+            return await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Error fetching {url}: {e}")
+        return None
+
+async def discover_links_async(url: str, session: aiohttp.ClientSession) -> list:
+    """
+    Fetches a Business Times page and discovers its resource links.
+
+    Args:
+        url: The URL of the page to fetch.
+        session: The aiohttp session shared by all concurrent fetches.
+
+    Returns:
+        A list of unique, absolute URLs to resources found on the page,
+        or an empty list if the page could not be fetched.
+    """
+    html_content = await fetch_page(url, session)
+    return discover_links(html_content) if html_content else []
@@ -1,8 +1,7 @@
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 def parse(html_content: str) -> str:
     """
@@ -15,18 +14,18 @@ def parse(html_content: str) -> str:
         The extracted article text, or an empty string if content is not found.
     """
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
+        tree = HTMLParser(html_content)
 
         # The main article content is often in a div with a specific class.
         # Based on inspection, 'prose' is a likely candidate for article content.
-        content_element = soup.find('div', class_='prose')
+        content_element = tree.css_first('div.prose')
         
         if content_element:
-            return content_element.get_text(separator='\n', strip=True)
+            return content_element.text(separator='\n', strip=True)
 
-        logging.warning("Parser could not find the main content element with class 'prose'. The site structure may have changed.")
+        logger.warning("Parser could not find the main content element with class 'prose'. The site structure may have changed.")
         return ""
 
     except Exception as e:
-        logging.error(f"An error occurred during parsing: {e}")
+        logger.error(f"An error occurred during parsing: {e}")
         return ""
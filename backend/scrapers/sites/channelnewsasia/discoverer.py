@@ -1,42 +1,97 @@
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import asyncio
+import aiohttp
+from selectolax.parser import HTMLParser
 import logging
+import xxhash
+from typing import Optional, Union
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-def discover_links(html_content: str, base_url: str = "https://www.channelnewsasia.com") -> list:
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+def _is_relative(href: str) -> bool:
+    # Same as startswith('/') and not startswith('//'), as plain index checks
+    return len(href) > 1 and href[0] == '/' and href[1] != '/'
+
+def discover_links(html_content: Union[str, bytes], base_url: str = "https://www.channelnewsasia.com") -> list:
     """
     Discovers all resource links from a CNA category page by finding links within headline tags.
 
     Args:
-        html_content: The HTML content of the page as a string.
+        html_content: The HTML content of the page, as a string or raw bytes.
         base_url: The base URL to resolve relative links.
 
     Returns:
         A list of unique, absolute URLs to resources found on the page.
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    links = set()
-
-    # Find all headline tags (h1, h2, h3, h6) which commonly contain resource links.
-    for tag in soup.find_all(['h1', 'h2', 'h3', 'h6']):
-        a_tag = tag.find('a', href=True)
-        if a_tag:
-            href = a_tag['href']
-            # Ensure the link is a relative path to a resource, not an external site or anchor.
-            if href.startswith('/') and not href.startswith('//') and not href.startswith('/video'):
-                full_url = urljoin(base_url, href)
-                links.add(full_url)
-
-    logging.info(f"Discovered {len(links)} unique resource links from {base_url}.")
-    return list(links)
+    tree = HTMLParser(html_content)
+    # Dedupe on 64-bit digests; keep the URLs in discovery order
+    seen = set()
+    links = []
+    # Hrefs are checked to be root-relative, so joining is plain concatenation
+    root = base_url.rstrip('/')
+
+    # Find links inside headline tags (h1, h2, h3, h6), which commonly contain resource links.
+    for a_tag in tree.css('h1 a[href], h2 a[href], h3 a[href], h6 a[href]'):
+        href = a_tag.attributes.get('href') or ''
+        # Ensure the link is a relative path to a resource, not an external site or anchor.
+        if _is_relative(href) and not href.startswith('/video'):
+            full_url = root + href
+            digest = xxhash.xxh3_64_intdigest(full_url)
+            if digest not in seen:
+                seen.add(digest)
+                links.append(full_url)
+
+    logger.info(f"Discovered {len(links)} unique resource links from {base_url}.")
+    return links
+
+async def fetch_page(url: str, session: aiohttp.ClientSession) -> Optional[bytes]:
+    """
+    Fetches a CNA page with a shared aiohttp session.
+
+    Args:
+        url: The URL of the page to fetch.
+        session: The aiohttp session shared by all concurrent fetches.
+
+    Returns:
+        The raw HTML bytes of the page, or None if it could not be fetched.
+        The bytes go straight to the parser, which detects the encoding itself.
+    """
+    try:
+        async with session.get(url, timeout=FETCH_TIMEOUT, headers=HEADERS) as response:
+            response.raise_for_status()
+            return await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Error fetching {url}: {e}")
+        return None
+
+async def discover_links_async(url: str, session: aiohttp.ClientSession) -> list:
+    """
+    Fetches a CNA page and discovers its resource links.
+
+    Args:
+        url: The URL of the page to fetch.
+        session: The aiohttp session shared by all concurrent fetches.
+
+    Returns:
+        A list of unique, absolute URLs to resources found on the page,
+        or an empty list if the page could not be fetched.
+    """
+    html_content = await fetch_page(url, session)
+    return discover_links(html_content) if html_content else []
+
+async def _discover_from_url(url: str) -> list:
+    async with aiohttp.ClientSession() as session:
+        return await discover_links_async(url, session)
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     international_url = 'https://www.channelnewsasia.com/international'
     print(f"--- Discovering links from: {international_url} ---")
-    discovered_links = discover_links(international_url)
+    discovered_links = asyncio.run(_discover_from_url(international_url))
 
     if discovered_links:
         print(f"Found {len(discovered_links)} links:")
@@ -1,8 +1,7 @@
 import logging
-from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 def parse(html_content: str) -> str:
     """
@@ -17,28 +16,31 @@ def parse(html_content: str) -> str:
         A clean string containing only the article's body text, or an empty string if parsing fails.
     """
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
+        tree = HTMLParser(html_content)
 
         # Find all divs with the 'text-long' class. CNA pages can have multiple.
-        possible_bodies = soup.find_all('div', class_='text-long')
+        possible_bodies = tree.css('div.text-long')
 
         if not possible_bodies:
-            logging.warning("CNA Parser: Could not find any 'div.text-long' elements. Page structure may have changed.")
+            logger.warning("CNA Parser: Could not find any 'div.text-long' elements. Page structure may have changed.")
             return ""
 
         # Iterate through the found divs and return the first one with substantial content.
         for body in possible_bodies:
-            paragraphs = body.find_all('p')
-            clean_text = ' '.join(p.get_text(strip=True) for p in paragraphs)
+            # Cheap pre-filter: skip short sidebars and captions before walking their paragraphs
+            if len(body.text(strip=True)) < 200:
+                continue
+            paragraphs = body.css('p')
+            clean_text = ' '.join(p.text(strip=True) for p in paragraphs)
             
             # Assume the main content will be longer than a certain threshold (e.g., 200 chars).
             if len(clean_text) > 200:
-                logging.info(f"Successfully parsed article, extracted {len(clean_text)} characters.")
+                logger.info(f"Successfully parsed article, extracted {len(clean_text)} characters.")
                 return clean_text
         
-        logging.warning("CNA Parser: Found 'text-long' divs, but none contained sufficient text content.")
+        logger.warning("CNA Parser: Found 'text-long' divs, but none contained sufficient text content.")
         return ""
 
     except Exception as e:
-        logging.error(f"An error occurred while parsing the article with BeautifulSoup: {e}")
+        logger.error(f"An error occurred while parsing the article: {e}")
         return ""
@@ -1,7 +1,23 @@
-import re
-from typing import Dict, Any
-from urllib.parse import urlparse
-from ...base import BaseCrawler
+from typing import Dict, Any, Optional
+from ...base import BaseCrawler, ExtractedContent
+from ...base.categorizer import categorize, register
+from .._cleaners import clean_ft
+from .._common import section_from_url
+
+# Category keywords for URLs, then for the head of the content
+register('ft', {
+    'markets': ['markets', 'trading'],
+    'business': ['companies', 'business'],
+    'technology': ['technology', 'tech'],
+    'world': ['world', 'international'],
+    'opinion': ['opinion', 'comment'],
+}, {
+    'markets': ['market', 'trading', 'investor', 'stock'],
+    'business': ['company', 'corporate', 'earnings', 'revenue'],
+    'technology': ['technology', 'software', 'digital', 'innovation'],
+    'world': ['international', 'global', 'world', 'country'],
+})
+
 
 class FTCrawler(BaseCrawler):
     """Financial Times crawler with financial news focus."""
@@ -19,16 +35,16 @@ class FTCrawler(BaseCrawler):
             }
         }
     
-    def extract_content(self, result) -> Dict[str, Any]:
+    def extract_content(self, result) -> Optional[ExtractedContent]:
         """Extract content from FT pages."""
         # Handle CrawlResultContainer
         if hasattr(result, '_results') and result._results:
             result = result._results[0]
         
         # Get raw content
-        passage = getattr(result, 'markdown', None) or getattr(result, 'extracted_content', None)
-        if not passage:
-            return {}
+        passage, url = self._passage_and_url(result)
+        if not passage or len(passage) < self._min_passage_chars:
+            return None
         
         # Extract metadata
         metadata = self._extract_metadata(result)
@@ -37,93 +53,29 @@ class FTCrawler(BaseCrawler):
         cleaned_content = self._clean_ft_content(passage)
         
         # Determine category from URL or content
-        url = getattr(result, 'url', '')
         category = self._determine_category(url, cleaned_content)
         
         # Extract section from URL
         section = self._extract_section_from_url(url)
         
-        return {
-            'content': cleaned_content,
-            'title': metadata.get('title', ''),
-            'summary': metadata.get('summary', ''),
-            'published_at': metadata.get('published_at'),
-            'author': metadata.get('author', ''),
-            'category': category,
-            'section': section
-        }
+        return ExtractedContent(
+            content=cleaned_content,
+            title=metadata.get('title', ''),
+            summary=metadata.get('summary', ''),
+            published_at=metadata.get('published_at'),
+            author=metadata.get('author', ''),
+            category=category,
+            section=section
+        )
     
     def _clean_ft_content(self, content: str) -> str:
         """Clean FT-specific content patterns."""
-        if not content:
-            return ""
-        
-        # FT-specific patterns
-        ft_patterns = [
-            r'Accessibility help.*?\]',
-            r'Skip to navigation.*?\]',
-            r'Skip to content.*?\]',
-            r'Skip to footer.*?\]',
-            r'Financial Times.*?\]',
-            r'Subscribe.*?\]',
-            r'Sign in.*?\]',
-            r'MyFT.*?\]',
-            r'Portfolio.*?\]',
-            r'Markets.*?\]',
-            r'Companies.*?\]',
-            r'Technology.*?\]',
-            r'World.*?\]',
-            r'Opinion.*?\]',
-        ]
-        
-        cleaned = content
-        for pattern in ft_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
-        
-        return cleaned
+        return clean_ft(content)
     
     def _determine_category(self, url: str, content: str) -> str:
         """Determine content category based on URL and content."""
-        url_lower = url.lower()
-        content_lower = content.lower()
-        
-        # URL-based categorization
-        if 'markets' in url_lower or 'trading' in url_lower:
-            return 'markets'
-        elif 'companies' in url_lower or 'business' in url_lower:
-            return 'business'
-        elif 'technology' in url_lower or 'tech' in url_lower:
-            return 'technology'
-        elif 'world' in url_lower or 'international' in url_lower:
-            return 'world'
-        elif 'opinion' in url_lower or 'comment' in url_lower:
-            return 'opinion'
-        
-        # Content-based categorization
-        if any(word in content_lower for word in ['market', 'trading', 'investor', 'stock']):
-            return 'markets'
-        elif any(word in content_lower for word in ['company', 'corporate', 'earnings', 'revenue']):
-            return 'business'
-        elif any(word in content_lower for word in ['technology', 'software', 'digital', 'innovation']):
-            return 'technology'
-        elif any(word in content_lower for word in ['international', 'global', 'world', 'country']):
-            return 'world'
-        
-        return 'general'
+        return categorize('ft', url, content)
     
     def _extract_section_from_url(self, url: str) -> str:
         """Extract section from FT URL."""
-        try:
-            path = urlparse(url).path
-            if path.startswith('/'):
-                path = path[1:]
-            sections = path.split('/')
-            if sections:
-                return sections[0]
-        except:
-            pass
-        return 'general' 
\ No newline at end of file
+        return section_from_url(url)
\ No newline at end of file
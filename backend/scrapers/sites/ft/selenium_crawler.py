@@ -1,6 +1,6 @@
 from backend.scrapers.base.selenium_base_crawler import SeleniumBaseCrawler
-from bs4 import BeautifulSoup
-import re
+from backend.scrapers.sites._cleaners import clean_ft
+from selectolax.parser import HTMLParser
 
 class FTSeleniumCrawler(SeleniumBaseCrawler):
     def __init__(self, headless=True):
@@ -12,22 +12,23 @@ class FTSeleniumCrawler(SeleniumBaseCrawler):
         html = self.fetch_page(url)
         if not html:
             return None
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = HTMLParser(html)
         
         # Try to extract title
-        title = soup.title.string if soup.title else ''
+        title_node = tree.css_first('title')
+        title = title_node.text() if title_node else ''
         
         # Try to extract main content
-        main = soup.select_one(main_selector)
-        if main and len(main.get_text()) > 200:
-            content = main.get_text(separator=' ', strip=True)
+        main = tree.css_first(main_selector)
+        if main and len(main.text()) > 200:
+            content = main.text(separator=' ', strip=True)
         else:
             # Fallback: try <main> or all text
-            main2 = soup.find('main')
-            if main2 and len(main2.get_text()) > 200:
-                content = main2.get_text(separator=' ', strip=True)
+            main2 = tree.css_first('main')
+            if main2 and len(main2.text()) > 200:
+                content = main2.text(separator=' ', strip=True)
             else:
-                content = soup.get_text(separator=' ', strip=True)
+                content = tree.root.text(separator=' ', strip=True) if tree.root else ''
         
         # Clean FT-specific content patterns
         cleaned_content = self._clean_ft_content(content)
@@ -41,33 +42,4 @@ class FTSeleniumCrawler(SeleniumBaseCrawler):
     
     def _clean_ft_content(self, content: str) -> str:
         """Clean FT-specific content patterns."""
-        if not content:
-            return ""
-        
-        # FT-specific patterns to remove
-        ft_patterns = [
-            r'Accessibility help.*?\]',
-            r'Skip to navigation.*?\]',
-            r'Skip to content.*?\]',
-            r'Skip to footer.*?\]',
-            r'Financial Times.*?\]',
-            r'Subscribe.*?\]',
-            r'Sign in.*?\]',
-            r'MyFT.*?\]',
-            r'Portfolio.*?\]',
-            r'Markets.*?\]',
-            r'Companies.*?\]',
-            r'Technology.*?\]',
-            r'World.*?\]',
-            r'Opinion.*?\]',
-        ]
-        
-        cleaned = content
-        for pattern in ft_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
-        
-        return cleaned 
\ No newline at end of file
+        return clean_ft(content)
\ No newline at end of file
@@ -5,32 +5,273 @@ Handles screenshot capture, AI image generation, and image optimization.
 
 import os
 import asyncio
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 import hashlib
 import aiohttp
-import aiofiles
-from PIL import Image, ImageDraw, ImageFont
+import xxhash
+from cachetools import LRUCache
+from selectolax.parser import HTMLParser
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, features
+import PIL
 import io
 import base64
+import multiprocessing
+from functools import lru_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Largest external image we will download before resizing
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+
+# Origin validators (ETag / Last-Modified) for cached external images; a cached
+# image older than the TTL is revalidated with a conditional GET
+IMAGE_CACHE_DB = "data/image_cache.sqlite"
+IMAGE_CACHE_TTL = 7 * 24 * 3600
+
+# Featured image meta tags, in order of preference: Open Graph, then Twitter card
+_IMAGE_META_SELECTORS = ('meta[property="og:image"]', 'meta[name="twitter:image"]')
+
+def _featured_image_url(html: bytes) -> Optional[str]:
+    """Return the page's featured image URL from its meta tags, if any."""
+    tree = HTMLParser(html)
+    for selector in _IMAGE_META_SELECTORS:
+        tag = tree.css_first(selector)
+        content = tag.attributes.get('content') if tag else None
+        if content:
+            return content
+    return None
+
+# Enhanced category color schemes with gradients: (primary, secondary, emoji, accent)
+_COLOR_SCHEMES = {
+    'business': ('#667eea', '#764ba2', '💼', '#f093fb'),
+    'technology': ('#4facfe', '#00f2fe', '💻', '#43e97b'),
+    'politics': ('#fa709a', '#fee140', '🏛️', '#ffecd2'),
+    'finance': ('#a8edea', '#fed6e3', '💰', '#ffd89b'),
+    'property': ('#d299c2', '#fef9d7', '🏠', '#89f7fe'),
+    'transport': ('#89f7fe', '#66a6ff', '🚇', '#a8edea'),
+    'education': ('#ffecd2', '#fcb69f', '🎓', '#ff8a80'),
+    'healthcare': ('#ff9a9e', '#fecfef', '🏥', '#ffecd2'),
+    'environment': ('#a8e6cf', '#dcedc1', '🌱', '#ffd3a5'),
+    'sports': ('#ffa726', '#ff7043', '⚽', '#ffcc02'),
+    'entertainment': ('#667eea', '#764ba2', '🎭', '#f093fb'),
+}
+_DEFAULT_SCHEME = ('#607D8B', '#455A64', '📰', '#90A4AE')
+
+def _check_image_codecs():
+    """Warn when Pillow lacks the fast JPEG codec or SIMD resampling."""
+    if not features.check_feature('libjpeg_turbo'):
+        logger.warning("Pillow is not built with libjpeg-turbo; JPEG decode/encode will be slower")
+    if '.post' not in PIL.__version__:
+        logger.info("Using stock Pillow; install pillow-simd for faster image resizing")
+
+# One validator store connection shared by the worker threads that use it
+_VALIDATORS: Optional[sqlite3.Connection] = None
+_VALIDATORS_LOCK = threading.Lock()
+
+def _open_validators():
+    """Open the shared validator store and create its table, once per process."""
+    global _VALIDATORS
+    with _VALIDATORS_LOCK:
+        if _VALIDATORS is None:
+            os.makedirs(os.path.dirname(IMAGE_CACHE_DB), exist_ok=True)
+            conn = sqlite3.connect(IMAGE_CACHE_DB, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS validators "
+                "(url_hash TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, fetched_at REAL)"
+            )
+            conn.commit()
+            _VALIDATORS = conn
+
+def _load_validators(url_hash: str) -> Optional[Tuple[Optional[str], Optional[str], float]]:
+    """Return (etag, last_modified, fetched_at) for a cached image, if recorded."""
+    with _VALIDATORS_LOCK:
+        return _VALIDATORS.execute(
+            "SELECT etag, last_modified, fetched_at FROM validators WHERE url_hash = ?", (url_hash,)
+        ).fetchone()
+
+def _save_validators(url_hash: str, etag: Optional[str], last_modified: Optional[str]):
+    """Record a cached image's validators and mark it fresh."""
+    with _VALIDATORS_LOCK, _VALIDATORS:
+        _VALIDATORS.execute(
+            "INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?)",
+            (url_hash, etag, last_modified, time.time())
+        )
+
+@lru_cache(maxsize=2)
+def _gradient_geometry(size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return the color-independent part of the placeholder gradient for size:
+    which half of the diagonal each pixel is in, its smoothstepped position
+    within that half, and the texture noise mask. Built once per size and
+    shared by every category.
+    """
+    diagonal = np.add.outer(np.arange(size[1]), np.arange(size[0]))
+    ratio = (diagonal / (size[0] + size[1])).astype(np.float32)
+    
+    # Smooth curve for better gradient
+    ratio = ratio * ratio * (3.0 - 2.0 * ratio)  # Smoothstep function
+    ratio = ratio[..., None]
+    
+    first_half = ratio < 0.5
+    local_ratio = np.where(first_half, ratio * 2, (ratio - 0.5) * 2)
+    return first_half, local_ratio, diagonal % 3 == 0
+
+def _write_bytes(path: str, data: bytes):
+    """Write data to path in one call; run via asyncio.to_thread."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+# Encoded placeholder JPEGs by category, so they can be served without disk reads
+_PLACEHOLDER_BYTES = LRUCache(maxsize=32)
+
+# Placeholder fonts, loaded once and shared by every placeholder
+_FONT_CACHE = {}
+
+def _get_fonts():
+    """Return the (text, emoji) fonts for placeholders, loading them on first use."""
+    if not _FONT_CACHE:
+        try:
+            # Try to load a nice font
+            _FONT_CACHE['text'] = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 120)
+            _FONT_CACHE['emoji'] = ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", 200)
+        except:
+            # Fallback to default font
+            _FONT_CACHE['text'] = _FONT_CACHE['emoji'] = ImageFont.load_default()
+    return _FONT_CACHE['text'], _FONT_CACHE['emoji']
+
+def _render_placeholder(category_lower: str, placeholder_path: str):
+    """
+    Draw a category's gradient placeholder and save it to placeholder_path.
+    """
+    # Create placeholder image
+    size = (1080, 1080)
+    primary_color, secondary_color, emoji, accent_color = _COLOR_SCHEMES.get(
+        category_lower, _DEFAULT_SCHEME
+    )
+
+    # Create smooth diagonal gradient background in one vectorized pass
+    c1, c2, c3 = (
+        np.array([int(color[k:k+2], 16) for k in (1, 3, 5)], dtype=np.float32)
+        for color in (primary_color, secondary_color, accent_color)
+    )
+    first_half, local_ratio, noise_mask = _gradient_geometry(size)
+
+    # First half: primary to secondary; second half: secondary to accent
+    start = np.where(first_half, c1, c2)
+    delta = np.where(first_half, c2 - c1, c3 - c2)
+    pixels = (start + delta * local_ratio).astype(np.int16)
+
+    # Add subtle noise for texture
+    pixels[noise_mask] += 5
+
+    image = Image.fromarray(np.minimum(pixels, 255).astype(np.uint8), 'RGB')
+    draw = ImageDraw.Draw(image)
+
+    # Add category text and emoji
+    font, emoji_font = _get_fonts()
+
+    # Draw emoji
+    emoji_bbox = draw.textbbox((0, 0), emoji, font=emoji_font)
+    emoji_width = emoji_bbox[2] - emoji_bbox[0]
+    emoji_height = emoji_bbox[3] - emoji_bbox[1]
+    emoji_x = (size[0] - emoji_width) // 2
+    emoji_y = (size[1] - emoji_height) // 2 - 100
+    draw.text((emoji_x, emoji_y), emoji, font=emoji_font, fill='white')
+
+    # Draw category name
+    category_text = category_lower.title()
+    text_bbox = draw.textbbox((0, 0), category_text, font=font)
+    text_width = text_bbox[2] - text_bbox[0]
+    text_height = text_bbox[3] - text_bbox[1]
+    text_x = (size[0] - text_width) // 2
+    text_y = emoji_y + 250
+
+    # Add text shadow
+    draw.text((text_x + 2, text_y + 2), category_text, font=font, fill='black')
+    draw.text((text_x, text_y), category_text, font=font, fill='white')
+
+    # Save placeholder, keeping the encoded bytes for get_placeholder_bytes
+    output = io.BytesIO()
+    image.save(output, 'JPEG', quality=90)
+    _PLACEHOLDER_BYTES[category_lower] = output.getvalue()
+    _write_bytes(placeholder_path, _PLACEHOLDER_BYTES[category_lower])
+
+@lru_cache(maxsize=32)
+def _placeholder_url(placeholder_dir: str, category_lower: str) -> str:
+    """
+    Return a category's placeholder URL, generating the image on first use.
+    Memoized, so the disk is only checked once per category per process;
+    failures raise and are retried on the next call.
+    """
+    placeholder_path = os.path.join(placeholder_dir, f"{category_lower}.jpg")
+
+    # Check if placeholder already exists
+    if not os.path.exists(placeholder_path):
+        _render_placeholder(category_lower, placeholder_path)
+
+    return f"/placeholders/{category_lower}.jpg"
+
 class ImageGenerator:
     """Service for generating images for Instagram-style posts"""
     
     def __init__(self):
         self.cache_dir = "data/images"
         self.placeholder_dir = "data/placeholders"
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # Process pool for CPU-bound image work, started on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.ensure_directories()
+        # Pool workers re-import this module; only report codecs and open the
+        # validator store in the main process
+        if multiprocessing.parent_process() is None:
+            _check_image_codecs()
+            _open_validators()
     
     def ensure_directories(self):
         """Ensure image directories exist"""
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(self.placeholder_dir, exist_ok=True)
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use, so
+        connections and DNS lookups are reused across image requests.
+        """
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+                    self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the image processing pool, starting it on first use.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._pool
+    
+    async def close(self):
+        """
+        Close the shared HTTP session and the image processing pool.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
     async def generate_post_image(self, article_data: Dict[str, Any]) -> str:
         """
         Generate an image for an Instagram post.
@@ -100,26 +341,15 @@ class ImageGenerator:
             return None
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        
-                        # Simple image extraction (would use BeautifulSoup in production)
-                        # Look for common meta tags
-                        import re
-                        
-                        # Try Open Graph image
-                        og_match = re.search(r'<meta property="og:image" content="([^"]+)"', html)
-                        if og_match:
-                            image_url = og_match.group(1)
-                            return await self.cache_external_image(image_url)
-                        
-                        # Try Twitter card image
-                        twitter_match = re.search(r'<meta name="twitter:image" content="([^"]+)"', html)
-                        if twitter_match:
-                            image_url = twitter_match.group(1)
-                            return await self.cache_external_image(image_url)
+            session = await self._get_session()
+            async with session.get(url, timeout=10) as response:
+                if response.status == 200:
+                    html = await response.read()
+                    
+                    # Look for Open Graph / Twitter card image meta tags
+                    image_url = _featured_image_url(html)
+                    if image_url:
+                        return await self.cache_external_image(image_url)
             
             return None
             
@@ -131,43 +361,105 @@ class ImageGenerator:
         """
         Download and cache external image.
         """
+        # Set when a stale cached copy exists, to fall back on if revalidation fails
+        stale_url = None
         try:
             # Generate cache filename
-            url_hash = hashlib.md5(image_url.encode()).hexdigest()
-            cache_path = os.path.join(self.cache_dir, f"{url_hash}.jpg")
+            url_hash = xxhash.xxh3_64_hexdigest(image_url)
+            cache_path = os.path.join(self.cache_dir, f"{url_hash}.webp")
             
-            # Check if already cached
+            # Check if already cached, including files cached under the old MD5 names
+            headers = {}
             if os.path.exists(cache_path):
-                return f"/images/{url_hash}.jpg"
+                validators = await asyncio.to_thread(_load_validators, url_hash)
+                if not validators or time.time() - validators[2] < IMAGE_CACHE_TTL:
+                    return f"/images/{url_hash}.webp"
+                # Stale: revalidate, so an unchanged image costs no body bytes
+                stale_url = f"/images/{url_hash}.webp"
+                etag, last_modified, _ = validators
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            else:
+                legacy_hash = hashlib.md5(image_url.encode()).hexdigest()
+                for legacy_name in (f"{legacy_hash}.webp", f"{legacy_hash}.jpg"):
+                    if os.path.exists(os.path.join(self.cache_dir, legacy_name)):
+                        return f"/images/{legacy_name}"
             
             # Download image
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url, timeout=10) as response:
-                    if response.status == 200:
-                        image_data = await response.read()
-                        
-                        # Optimize and save image
-                        optimized_data = self.optimize_image(image_data)
-                        
-                        async with aiofiles.open(cache_path, 'wb') as f:
-                            await f.write(optimized_data)
-                        
-                        return f"/images/{url_hash}.jpg"
+            session = await self._get_session()
+            async with session.get(image_url, timeout=10, headers=headers) as response:
+                if response.status == 304:
+                    await asyncio.to_thread(
+                        _save_validators, url_hash,
+                        response.headers.get('ETag', headers.get('If-None-Match')),
+                        response.headers.get('Last-Modified', headers.get('If-Modified-Since'))
+                    )
+                    return f"/images/{url_hash}.webp"
+                if response.status == 200:
+                    image_data = await self._read_capped(response)
+                    if image_data is None:
+                        logger.warning(f"Skipping image larger than {MAX_IMAGE_BYTES} bytes: {image_url}")
+                        return stale_url
+                    
+                    # Optimize off the event loop, then save image
+                    optimized_data = await asyncio.get_running_loop().run_in_executor(
+                        self._get_pool(), ImageGenerator._optimize_image_static, image_data
+                    )
+                    if optimized_data is None:
+                        # Never store undecodable or non-WebP bytes under a .webp name
+                        return stale_url
+                    
+                    await asyncio.to_thread(_write_bytes, cache_path, optimized_data)
+                    await asyncio.to_thread(
+                        _save_validators, url_hash,
+                        response.headers.get('ETag'), response.headers.get('Last-Modified')
+                    )
+                    
+                    return f"/images/{url_hash}.webp"
             
-            return None
+            # Keep serving a stale copy if the origin could not be revalidated
+            return stale_url
             
         except Exception as e:
             logger.error(f"Error caching image {image_url}: {e}")
+            return stale_url
+    
+    @staticmethod
+    async def _read_capped(response) -> Optional[bytes]:
+        """
+        Stream a response body, giving up once it exceeds MAX_IMAGE_BYTES.
+        """
+        if (response.content_length or 0) > MAX_IMAGE_BYTES:
             return None
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            buf += chunk
+            if len(buf) > MAX_IMAGE_BYTES:
+                return None
+        return bytes(buf)
+    
+    def optimize_image(self, image_data: bytes) -> Optional[bytes]:
+        """
+        Optimize image for Instagram-style posts (1080x1080 square WebP).
+        Returns None if the image could not be decoded or encoded.
+        """
+        return self._optimize_image_static(image_data)
     
-    def optimize_image(self, image_data: bytes) -> bytes:
+    @staticmethod
+    def _optimize_image_static(image_data: bytes) -> Optional[bytes]:
         """
-        Optimize image for Instagram-style posts (1080x1080 square).
+        Picklable body of optimize_image, run in the image processing pool.
         """
         try:
             # Open image
             image = Image.open(io.BytesIO(image_data))
             
+            # Let JPEGs decode at a reduced DCT scale, keeping at least 2x the
+            # output size for the LANCZOS resize (no-op for other formats)
+            image.draft('RGB', (2160, 2160))
+            
             # Convert to RGB if necessary
             if image.mode != 'RGB':
                 image = image.convert('RGB')
@@ -192,132 +484,51 @@ class ImageGenerator:
                 right = crop_size
                 bottom = top + crop_size
             
-            # Crop and resize
-            image = image.crop((left, top, right, bottom))
-            image = image.resize(size, Image.Resampling.LANCZOS)
+            # Crop and resize in one resampling pass; reducing_gap lets large
+            # downscales start with a cheap integer reduce()
+            image = image.resize(
+                size, Image.Resampling.LANCZOS, box=(left, top, right, bottom), reducing_gap=3.0
+            )
             
             # Save optimized image
             output = io.BytesIO()
-            image.save(output, format='JPEG', quality=85, optimize=True)
+            image.save(output, format='WEBP', quality=80, method=6)
             return output.getvalue()
             
         except Exception as e:
             logger.error(f"Error optimizing image: {e}")
-            return image_data
+            return None
     
     def generate_category_placeholder(self, category: str) -> str:
         """
         Generate a beautiful category-based placeholder image.
         """
         try:
-            category_lower = category.lower()
-            placeholder_path = os.path.join(self.placeholder_dir, f"{category_lower}.jpg")
-            
-            # Check if placeholder already exists
-            if os.path.exists(placeholder_path):
-                return f"/placeholders/{category_lower}.jpg"
-            
-            # Create placeholder image
-            size = (1080, 1080)
-            
-            # Enhanced category color schemes with gradients
-            color_schemes = {
-                'business': ('#667eea', '#764ba2', '💼', '#f093fb'),
-                'technology': ('#4facfe', '#00f2fe', '💻', '#43e97b'),
-                'politics': ('#fa709a', '#fee140', '🏛️', '#ffecd2'),
-                'finance': ('#a8edea', '#fed6e3', '💰', '#ffd89b'),
-                'property': ('#d299c2', '#fef9d7', '🏠', '#89f7fe'),
-                'transport': ('#89f7fe', '#66a6ff', '🚇', '#a8edea'),
-                'education': ('#ffecd2', '#fcb69f', '🎓', '#ff8a80'),
-                'healthcare': ('#ff9a9e', '#fecfef', '🏥', '#ffecd2'),
-                'environment': ('#a8e6cf', '#dcedc1', '🌱', '#ffd3a5'),
-                'sports': ('#ffa726', '#ff7043', '⚽', '#ffcc02'),
-                'entertainment': ('#667eea', '#764ba2', '🎭', '#f093fb'),
-            }
-            
-            primary_color, secondary_color, emoji, accent_color = color_schemes.get(
-                category_lower, ('#607D8B', '#455A64', '📰', '#90A4AE')
-            )
-            
-            # Create smooth gradient background
-            image = Image.new('RGB', size, primary_color)
-            draw = ImageDraw.Draw(image)
-
-            # Create diagonal gradient effect
-            for i in range(size[1]):
-                for j in range(size[0]):
-                    # Calculate diagonal ratio
-                    ratio = (i + j) / (size[0] + size[1])
-                    ratio = min(1.0, max(0.0, ratio))
-
-                    # Smooth curve for better gradient
-                    ratio = ratio * ratio * (3.0 - 2.0 * ratio)  # Smoothstep function
-
-                    r1, g1, b1 = tuple(int(primary_color[j:j+2], 16) for j in (1, 3, 5))
-                    r2, g2, b2 = tuple(int(secondary_color[j:j+2], 16) for j in (1, 3, 5))
-                    r3, g3, b3 = tuple(int(accent_color[j:j+2], 16) for j in (1, 3, 5))
-
-                    if ratio < 0.5:
-                        # First half: primary to secondary
-                        local_ratio = ratio * 2
-                        r = int(r1 + (r2 - r1) * local_ratio)
-                        g = int(g1 + (g2 - g1) * local_ratio)
-                        b = int(b1 + (b2 - b1) * local_ratio)
-                    else:
-                        # Second half: secondary to accent
-                        local_ratio = (ratio - 0.5) * 2
-                        r = int(r2 + (r3 - r2) * local_ratio)
-                        g = int(g2 + (g3 - g2) * local_ratio)
-                        b = int(b2 + (b3 - b2) * local_ratio)
-
-                    # Add subtle noise for texture
-                    if (i + j) % 3 == 0:
-                        r = min(255, r + 5)
-                        g = min(255, g + 5)
-                        b = min(255, b + 5)
-
-                    draw.point((j, i), fill=(r, g, b))
-            
-            # Add category text and emoji
-            try:
-                # Try to load a nice font
-                font_size = 120
-                font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                emoji_font = ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", 200)
-            except:
-                # Fallback to default font
-                font = ImageFont.load_default()
-                emoji_font = ImageFont.load_default()
-            
-            # Draw emoji
-            emoji_bbox = draw.textbbox((0, 0), emoji, font=emoji_font)
-            emoji_width = emoji_bbox[2] - emoji_bbox[0]
-            emoji_height = emoji_bbox[3] - emoji_bbox[1]
-            emoji_x = (size[0] - emoji_width) // 2
-            emoji_y = (size[1] - emoji_height) // 2 - 100
-            draw.text((emoji_x, emoji_y), emoji, font=emoji_font, fill='white')
-            
-            # Draw category name
-            category_text = category.title()
-            text_bbox = draw.textbbox((0, 0), category_text, font=font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            text_x = (size[0] - text_width) // 2
-            text_y = emoji_y + 250
-            
-            # Add text shadow
-            draw.text((text_x + 2, text_y + 2), category_text, font=font, fill='black')
-            draw.text((text_x, text_y), category_text, font=font, fill='white')
-            
-            # Save placeholder
-            image.save(placeholder_path, 'JPEG', quality=90)
-            
-            return f"/placeholders/{category_lower}.jpg"
+            return _placeholder_url(self.placeholder_dir, category.lower())
             
         except Exception as e:
             logger.error(f"Error generating placeholder for {category}: {e}")
             return "/placeholders/default.jpg"
     
+    def get_placeholder_bytes(self, category: str) -> Optional[bytes]:
+        """
+        Return a generated placeholder's JPEG bytes, reading the file at most
+        once per process. None if no placeholder exists for the category.
+        """
+        category_lower = category.lower()
+        data = _PLACEHOLDER_BYTES.get(category_lower)
+        if data is None:
+            # Only plain names map to files in the placeholder directory
+            if not category_lower.replace('_', '').replace('-', '').isalnum():
+                return None
+            placeholder_path = os.path.join(self.placeholder_dir, f"{category_lower}.jpg")
+            if not os.path.exists(placeholder_path):
+                return None
+            with open(placeholder_path, 'rb') as f:
+                data = f.read()
+            _PLACEHOLDER_BYTES[category_lower] = data
+        return data
+    
     def get_image_url(self, relative_path: str) -> str:
         """
         Convert relative image path to full URL.
@@ -0,0 +1,197 @@
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import orjson
+from cachetools import LRUCache
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # optional: semantic caching is skipped without these
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when prompt templates change so stale responses are never served
+PROMPT_VERSION = 'v1'
+
+AI_CACHE_DB = 'data/ai_cache.sqlite'
+
+# Hot responses kept in process in front of SQLite
+AI_CACHE_MEMORY_SIZE = 4096
+
+# Near-duplicate articles (e.g. the same wire story from two sources) reuse a
+# cached category when their embeddings' cosine similarity reaches the threshold.
+# Summaries are never shared: two similar articles (yesterday's and today's
+# market wrap) can still differ in the facts a summary must carry.
+SEMANTIC_CACHE_DIR = 'data/semantic_cache'
+SEMANTIC_MODEL = 'all-MiniLM-L6-v2'
+SEMANTIC_THRESHOLD = 0.87
+# Leading characters embedded per article (~512 tokens)
+SEMANTIC_TEXT_CHARS = 2048
+# New entries buffered before the index is written to disk
+SEMANTIC_FLUSH_EVERY = 32
+
+class AICache:
+    """Persistent cache of Gemini responses, keyed by a hash of model, prompt version and prompt."""
+
+    def __init__(self, path: str = AI_CACHE_DB, memory_size: int = AI_CACHE_MEMORY_SIZE):
+        """Open (or create) the SQLite store at path."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._memory = LRUCache(maxsize=memory_size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, generation_config: Optional[dict] = None) -> str:
+        """
+        Build the cache key for a request.
+        Args:
+            model: Gemini model name
+            prompt: Full prompt text, which embeds the content being processed
+            generation_config: Optional generation config sent with the prompt
+        Returns:
+            Hex SHA-256 digest
+        """
+        config = repr(sorted(generation_config.items())) if generation_config else ''
+        raw = '\x1f'.join((model, PROMPT_VERSION, config, prompt))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            response = self._memory.get(key)
+            if response is None:
+                row = self._conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    response = self._memory[key] = row[0]
+        return response
+
+    def set(self, key: str, response: str):
+        """Store a successful response."""
+        with self._lock:
+            self._memory[key] = response
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error writing AI cache: {e}")
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+class SemanticCache:
+    """Embedding-similarity cache of Gemini responses, one FAISS index per namespace."""
+
+    def __init__(self, directory: str = SEMANTIC_CACHE_DIR, model_name: str = SEMANTIC_MODEL,
+                 threshold: float = SEMANTIC_THRESHOLD):
+        """Load the embedding model; indexes are read from directory on first use."""
+        os.makedirs(directory, exist_ok=True)
+        self._dir = directory
+        self._threshold = threshold
+        self._model = SentenceTransformer(model_name)
+        self._dim = self._model.get_sentence_embedding_dimension()
+        # namespace -> (inner-product index over normalized vectors, values by row)
+        self._indexes = {}
+        self._dirty = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _paths(self, namespace: str) -> Tuple[str, str]:
+        base = os.path.join(self._dir, namespace)
+        return f"{base}.faiss", f"{base}.json"
+
+    def _load(self, namespace: str) -> Tuple["faiss.Index", List[str]]:
+        """Return a namespace's index and values, reading them from disk once."""
+        if namespace not in self._indexes:
+            index_path, values_path = self._paths(namespace)
+            if os.path.exists(index_path) and os.path.exists(values_path):
+                index = faiss.read_index(index_path)
+                with open(values_path, 'rb') as f:
+                    values = orjson.loads(f.read())
+            else:
+                index, values = faiss.IndexFlatIP(self._dim), []
+            self._indexes[namespace] = (index, values)
+            self._dirty[namespace] = 0
+        return self._indexes[namespace]
+
+    def _embed(self, text: str) -> "np.ndarray":
+        """Unit-length embedding of the text's leading characters, so inner product is cosine."""
+        vector = self._model.encode([text[:SEMANTIC_TEXT_CHARS]], normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    def get(self, namespace: str, text: str) -> Optional[str]:
+        """Return the response cached for the most similar text, if similar enough."""
+        vector = self._embed(text)
+        with self._lock:
+            index, values = self._load(namespace)
+            if index.ntotal == 0:
+                return None
+            scores, ids = index.search(vector, 1)
+        if scores[0][0] >= self._threshold:
+            return values[ids[0][0]]
+        return None
+
+    def put(self, namespace: str, text: str, value: str):
+        """Store a successful response for text."""
+        vector = self._embed(text)
+        with self._lock:
+            index, values = self._load(namespace)
+            index.add(vector)
+            values.append(value)
+            self._dirty[namespace] += 1
+            if self._dirty[namespace] >= SEMANTIC_FLUSH_EVERY:
+                self._write(namespace)
+
+    def _write(self, namespace: str):
+        index, values = self._indexes[namespace]
+        index_path, values_path = self._paths(namespace)
+        try:
+            faiss.write_index(index, index_path)
+            with open(values_path, 'wb') as f:
+                f.write(orjson.dumps(values))
+            self._dirty[namespace] = 0
+        except Exception as e:
+            logger.error(f"Error writing semantic cache {namespace}: {e}")
+
+    def flush(self):
+        """Write every namespace with unsaved entries to disk."""
+        with self._lock:
+            for namespace, dirty in self._dirty.items():
+                if dirty:
+                    self._write(namespace)
+
+@lru_cache(maxsize=1)
+def get_ai_cache() -> AICache:
+    """Return the process-wide AI cache, opening it on first use."""
+    return AICache()
+
+@lru_cache(maxsize=1)
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Return the process-wide semantic cache, or None if its dependencies are missing."""
+    if faiss is None:
+        return None
+    try:
+        return SemanticCache()
+    except Exception as e:
+        logger.error(f"Semantic cache unavailable: {e}")
+        return None
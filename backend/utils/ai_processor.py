@@ -1,8 +1,15 @@
-import google.generativeai as genai
+import asyncio
+import httpx
+import orjson
 import logging
 import os
-from typing import Dict, List, Optional
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
+from .ai_cache import AICache, get_ai_cache, get_semantic_cache
 
 # Load environment variables
 load_dotenv('config/.env')
@@ -11,6 +18,245 @@ load_dotenv('config/.env')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum Gemini requests in flight per AIProcessor, to stay within quota
+GEMINI_CONCURRENCY = 8
+
+# Articles marshaled into one summary/categorization prompt
+AI_BATCH_SIZE = 8
+
+RESOURCE_CATEGORIES = (
+    "politics", "economy", "society", "technology", "health",
+    "education", "transport", "housing", "environment", "culture", "sports"
+)
+
+# Unambiguous Singapore news vocabulary per category, matched as whole words.
+# An article whose lead clearly favours one category skips the Gemini call.
+CATEGORY_KEYWORDS = {
+    "politics": ("parliament", "minister", "pap", "workers' party", "election", "cabinet", "istana"),
+    "economy": ("gdp", "mas", "inflation", "sgx", "stocks", "economy", "economic", "exports", "budget"),
+    "society": ("community", "residents", "volunteers", "seniors", "families", "charity", "migrant workers"),
+    "technology": ("ai", "artificial intelligence", "tech", "startup", "smart nation", "cybersecurity", "software", "semiconductor", "govtech"),
+    "health": ("moh", "hospital", "patients", "covid-19", "dengue", "vaccine", "healthcare", "medisave", "clinic"),
+    "education": ("moe", "students", "school", "schools", "psle", "university", "nus", "ntu", "teachers", "o-level", "a-level"),
+    "transport": ("mrt", "lta", "bus", "buses", "smrt", "sbs transit", "ez-link", "coe", "erp", "train", "changi airport"),
+    "housing": ("hdb", "bto", "resale", "flats", "cov", "condo", "property", "ura", "rental"),
+    "environment": ("climate", "nea", "haze", "recycling", "carbon", "emissions", "flooding", "biodiversity"),
+    "culture": ("arts", "museum", "festival", "heritage", "film", "music", "theatre", "nac", "concert"),
+    "sports": ("football", "sea games", "olympics", "athlete", "tournament", "medal", "swimming", "badminton"),
+}
+
+# The pre-classifier settles a category with at least this many hits and
+# twice as many as the runner-up
+PRECLASSIFY_MIN_HITS = 3
+
+# Lead characters scanned, matching what the categorization prompt sends
+PRECLASSIFY_CHARS = 500
+
+_CATEGORY_BY_KEYWORD = {keyword: category for category, keywords in CATEGORY_KEYWORDS.items() for keyword in keywords}
+_CATEGORY_SCANNER = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in sorted(_CATEGORY_BY_KEYWORD, key=len, reverse=True)) + r')\b'
+)
+
+def _preclassify(content: str) -> Optional[str]:
+    """Return a category the article's lead clearly belongs to, or None to ask Gemini."""
+    hits = {}
+    for match in _CATEGORY_SCANNER.finditer(content[:PRECLASSIFY_CHARS].lower()):
+        category = _CATEGORY_BY_KEYWORD[match.group(1)]
+        hits[category] = hits.get(category, 0) + 1
+    ranked = sorted(hits.values(), reverse=True) + [0]
+    if ranked[0] >= PRECLASSIFY_MIN_HITS and ranked[0] >= 2 * ranked[1]:
+        return max(hits, key=hits.get)
+    return None
+
+@lru_cache(maxsize=256)
+def _keyword_scanner(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a profile's keywords into one zero-width lookahead pattern.
+    At each position where any keyword starts, finditer captures the longest
+    keyword there, so overlapping keywords are never skipped.
+    """
+    alternation = '|'.join(re.escape(k) for k in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+def _keywords_in(keywords: Tuple[str, ...], text: str) -> Set[str]:
+    """
+    Return the keywords that occur in text, in a single scan.
+    A keyword occurs iff it is a substring of a capture: each occurrence is
+    a prefix of the longest keyword captured where it starts.
+    """
+    captures = {m.group(1) for m in _keyword_scanner(keywords).finditer(text)}
+    return {k for k in set(keywords) if any(k in capture for capture in captures)}
+
+@lru_cache(maxsize=1024)
+def _relevance_text(title: str, summary: str, content: str) -> str:
+    """
+    Lowercased title, summary and content joined for keyword scanning.
+    Cached so scoring the same article for many users lowercases it once;
+    string hashes are memoized, so a hit costs no pass over the content.
+    """
+    return '\0'.join((title.lower(), summary.lower(), content.lower()))
+
+# Article characters sent per prompt (~1000 tokens): the lead plus the closing lines
+PROMPT_HEAD_CHARS = 3000
+PROMPT_TAIL_CHARS = 1000
+
+def _truncate(text: str, head: int = PROMPT_HEAD_CHARS, tail: int = PROMPT_TAIL_CHARS) -> str:
+    """
+    Bound text to a prompt budget. News is written inverted-pyramid, so the
+    lead carries most of the facts; the last lines often hold the outcome.
+    """
+    if len(text) <= head + tail:
+        return text
+    logger.debug(f"Truncating {len(text)} characters of content to {head + tail}")
+    return f"{text[:head]}\n...\n{text[len(text) - tail:]}"
+
+# Prompt templates for the high-volume calls, filled with str.format. Their
+# text is part of every AI cache key, so edits invalidate cached responses.
+SUMMARY_PROMPT = """
+            Summarize the following information resource in {max_length} characters or less.
+            Focus on the key facts and main points. Write in a clear, objective tone.
+
+            Resource content:
+            {content}
+
+            Summary:
+            """
+
+CATEGORY_PROMPT = """
+            Categorize this information resource into one of these categories:
+            {categories}
+            Resource content: {content}...
+            Return only the category name, nothing else.
+            """
+
+BATCH_SUMMARY_PROMPT = """
+            Summarize each of the following {count} information resources in {max_length} characters or less.
+            Focus on the key facts and main points. Write in a clear, objective tone.
+
+            {resources}
+
+            Return a JSON array of exactly {count} summary strings, one per resource, in the same order.
+            """
+
+BATCH_CATEGORY_PROMPT = """
+            Categorize each of the following {count} information resources into one of these categories:
+            {categories}
+
+            {resources}
+
+            Return a JSON array of exactly {count} category names, one per resource, in the same order.
+            """
+
+RELEVANCE_PROMPT = """
+            Explain in one sentence why this information resource might be relevant to a user with these interests: {interests}
+            Resource title: {title}
+            Resource summary: {summary}
+            Write a brief, engaging explanation that highlights the connection to the user's interests.
+            """
+
+_CATEGORY_NAMES = ', '.join(RESOURCE_CATEGORIES)
+
+def _summary_prompt(content: str, max_length: int) -> str:
+    """Prompt for summarizing one resource; also its cache key source in batches."""
+    return SUMMARY_PROMPT.format(max_length=max_length, content=_truncate(content))
+
+def _category_prompt(content: str) -> str:
+    """Prompt for categorizing one resource; also its cache key source in batches."""
+    return CATEGORY_PROMPT.format(categories=_CATEGORY_NAMES, content=content[:500])
+
+async def _gather_chunks(process_chunk, items: List) -> List:
+    """
+    Run process_chunk over AI_BATCH_SIZE slices of items concurrently and
+    concatenate the per-chunk result lists in order.
+    """
+    chunks = [items[i:i + AI_BATCH_SIZE] for i in range(0, len(items), AI_BATCH_SIZE)]
+    results = await asyncio.gather(*(process_chunk(chunk) for chunk in chunks))
+    return [item for chunk_results in results for item in chunk_results]
+
+async def _none():
+    """Stand-in for an enrichment that is not needed."""
+    return None
+
+GEMINI_MODEL = 'gemini-2.0-flash-exp'
+GEMINI_API_ROOT = "https://generativelanguage.googleapis.com/v1beta"
+GEMINI_URL = f"{GEMINI_API_ROOT}/models/{GEMINI_MODEL}:generateContent"
+# Batch Mode: asynchronous jobs at about half the price of generateContent
+GEMINI_BATCH_URL = f"{GEMINI_API_ROOT}/models/{GEMINI_MODEL}:batchGenerateContent"
+
+def _response_text(body: Dict) -> str:
+    """Text of the first candidate in a GenerateContentResponse."""
+    parts = body['candidates'][0]['content']['parts']
+    return ''.join(part.get('text', '') for part in parts)
+
+# Transient failures (rate limits, server errors, dropped connections) are
+# retried with full-jitter exponential backoff, capped at GEMINI_BACKOFF_MAX seconds
+GEMINI_MAX_ATTEMPTS = 4
+GEMINI_BACKOFF_MAX = 30
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# After this many consecutive transient failures Gemini is left alone for
+# BREAKER_RESET_SECONDS, then a single trial request decides whether to resume
+BREAKER_FAIL_MAX = 20
+BREAKER_RESET_SECONDS = 60
+
+class GeminiUnavailableError(RuntimeError):
+    """Raised instead of calling Gemini while the circuit breaker is open."""
+
+class _CircuitBreaker:
+    """Per-process breaker that stops requests after repeated transient failures."""
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Whether a request may go out; after the timeout, lets one trial through."""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            if self.opened_at is None:
+                logger.warning(f"Gemini failed {self.failures} times in a row; pausing requests for {self.reset_timeout}s")
+            self.opened_at = time.monotonic()
+
+_BREAKER = _CircuitBreaker(BREAKER_FAIL_MAX, BREAKER_RESET_SECONDS)
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed Gemini request is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _RETRYABLE_STATUS
+    return isinstance(error, httpx.TransportError)
+
+# One HTTP/2 client shared by every AIProcessor, so concurrent Gemini calls
+# are multiplexed over a single pooled connection
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Gemini HTTP client, creating it on first use."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(http2=True, timeout=60)
+    return _HTTP_CLIENT
+
+async def close_http_client():
+    """Close the shared Gemini HTTP client if it was opened."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 class AIProcessor:
     """Handles AI processing tasks using Google Gemini API."""
     
@@ -20,10 +266,116 @@ class AIProcessor:
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self._headers = {'x-goog-api-key': api_key}
+        self._sem = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        self._cache = get_ai_cache()
+        # None when sentence-transformers/faiss are not installed
+        self._semantic = get_semantic_cache()
+    
+    async def _generate(self, prompt: str, generation_config: Optional[Dict] = None, cached: bool = False,
+                        similar: Optional[Tuple[str, str]] = None) -> str:
+        """
+        Send a prompt to Gemini's REST API and return the response text.
+        At most GEMINI_CONCURRENCY requests are in flight at once, transient
+        failures are retried, and GeminiUnavailableError is raised without a
+        request while the circuit breaker is open. With cached,
+        identical prompts are answered from the persistent AI cache. similar is
+        a (namespace, content) pair that also lets a near-duplicate content's
+        response be reused from the semantic cache; it is only passed for
+        categories, since similar articles can still need different summaries.
+        """
+        if cached:
+            key = AICache.make_key(GEMINI_MODEL, prompt, generation_config)
+            # SQLite I/O and embedding run on worker threads, off the event loop
+            hit = await asyncio.to_thread(self._cache_lookup, key, similar)
+            if hit is not None:
+                return hit
+            text = await self._generate(prompt, generation_config)
+            await asyncio.to_thread(self._cache_store, key, text, similar)
+            return text
+        payload = {'contents': [{'parts': [{'text': prompt}]}]}
+        if generation_config:
+            payload['generationConfig'] = generation_config
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            if not _BREAKER.allow():
+                raise GeminiUnavailableError("Gemini circuit breaker is open")
+            try:
+                async with self._sem:
+                    response = await _get_http_client().post(GEMINI_URL, json=payload, headers=self._headers)
+                response.raise_for_status()
+            except (httpx.HTTPStatusError, httpx.TransportError) as e:
+                if not _is_transient(e):
+                    raise
+                _BREAKER.record_failure()
+                if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                    raise
+                # Backoff sleeps outside the semaphore, so other requests proceed
+                delay = random.uniform(0, min(GEMINI_BACKOFF_MAX, 2 ** attempt))
+                logger.warning(f"Gemini request failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            _BREAKER.record_success()
+            return _response_text(orjson.loads(response.content))
+
+    async def submit_batch(self, prompts: Dict[str, str], display_name: str = 'news-enrichment') -> Optional[str]:
+        """
+        Submit prompts as one Gemini Batch Mode job, for work that can wait hours.
+        Batch calls use a short-lived client of their own, so scheduler jobs
+        running on their own event loop never touch the shared one.
+        Args:
+            prompts: Prompt text by caller-chosen key, echoed back with each result
+            display_name: Job name shown in the Gemini console
+        Returns:
+            The batch name to poll with get_batch_results, or None if submission failed
+        """
+        requests = [
+            {'request': {'contents': [{'parts': [{'text': prompt}]}]}, 'metadata': {'key': key}}
+            for key, prompt in prompts.items()
+        ]
+        payload = {'batch': {'display_name': display_name, 'input_config': {'requests': {'requests': requests}}}}
+        try:
+            async with httpx.AsyncClient(timeout=120) as client:
+                response = await client.post(GEMINI_BATCH_URL, json=payload, headers=self._headers)
+            response.raise_for_status()
+            return orjson.loads(response.content)['name']
+        except Exception as e:
+            logger.error(f"Error submitting Gemini batch: {e}")
+            return None
+
+    async def get_batch_results(self, batch_name: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Fetch the results of a Batch Mode job.
+        Args:
+            batch_name: Name returned by submit_batch
+        Returns:
+            Response text by key (None for failed items) once the job has
+            finished, empty if the job itself failed, or None while it is
+            still running or could not be checked
+        """
+        try:
+            async with httpx.AsyncClient(timeout=120) as client:
+                response = await client.get(f"{GEMINI_API_ROOT}/{batch_name}", headers=self._headers)
+            response.raise_for_status()
+            body = orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"Error checking Gemini batch {batch_name}: {e}")
+            return None
+        if not body.get('done'):
+            return None
+        if 'error' in body:
+            logger.error(f"Gemini batch {batch_name} failed: {body['error']}")
+            return {}
+        results = {}
+        inlined = body.get('response', {}).get('inlinedResponses', {}).get('inlinedResponses', [])
+        for item in inlined:
+            key = item.get('metadata', {}).get('key')
+            try:
+                results[key] = _response_text(item['response'])
+            except (KeyError, IndexError):
+                results[key] = None
+        return results
     
-    def generate_summary(self, content: str, max_length: int = 200) -> Optional[str]:
+    async def generate_summary(self, content: str, max_length: int = 200) -> Optional[str]:
         """
         Generate a concise summary of the resource content.
         Args:
@@ -33,17 +385,8 @@ class AIProcessor:
             Generated summary or None if failed
         """
         try:
-            prompt = f"""
-            Summarize the following information resource in {max_length} characters or less.
-            Focus on the key facts and main points. Write in a clear, objective tone.
-
-            Resource content:
-            {content}
-
-            Summary:
-            """
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = await self._generate(_summary_prompt(content, max_length), cached=True)
+            return response_text.strip()
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             return None
@@ -78,8 +421,8 @@ class AIProcessor:
 
             AI Response:
             """
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = await self._generate(prompt)
+            return response_text.strip()
         except Exception as e:
             logger.error(f"Error generating comment response: {e}")
             return None
@@ -96,26 +439,24 @@ class AIProcessor:
         try:
             interests = user_profile.get('profile_q2_answer', '').lower()
             avoid_topics = user_profile.get('profile_q3_answer', '').lower()
-            title = resource.get('title', '').lower()
-            summary = resource.get('summary', '').lower()
-            content = resource.get('content', '').lower()
+            interest_keywords = tuple(word.strip() for word in interests.split(',') if word.strip())
+            avoid_keywords = tuple(word.strip() for word in avoid_topics.split(',') if word.strip())
+            # Title, summary and content are scanned once, for all keywords together
+            text = _relevance_text(
+                resource.get('title', ''), resource.get('summary', ''), resource.get('content', '')
+            )
             score = 50  # Base score
-            if interests:
-                interest_keywords = [word.strip() for word in interests.split(',') if word.strip()]
-                for keyword in interest_keywords:
-                    if keyword in title or keyword in summary or keyword in content:
-                        score += 10
-            if avoid_topics:
-                avoid_keywords = [word.strip() for word in avoid_topics.split(',') if word.strip()]
-                for keyword in avoid_keywords:
-                    if keyword in title or keyword in summary or keyword in content:
-                        score -= 15
+            if interest_keywords or avoid_keywords:
+                # One pass finds interest and avoid hits together
+                found = _keywords_in(interest_keywords + avoid_keywords, text)
+                score += 10 * sum(1 for keyword in interest_keywords if keyword in found)
+                score -= 15 * sum(1 for keyword in avoid_keywords if keyword in found)
             return max(0, min(100, score))
         except Exception as e:
             logger.error(f"Error calculating relevance score: {e}")
             return 50.0  # Default neutral score
     
-    def generate_relevance_explanation(self, resource: Dict, user_profile: Dict) -> Optional[str]:
+    async def generate_relevance_explanation(self, resource: Dict, user_profile: Dict) -> Optional[str]:
         """
         Generate an explanation of why a resource is relevant to the user.
         Args:
@@ -125,19 +466,18 @@ class AIProcessor:
             AI-generated explanation or None if failed
         """
         try:
-            prompt = f"""
-            Explain in one sentence why this information resource might be relevant to a user with these interests: {user_profile.get('profile_q2_answer', 'General information')}
-            Resource title: {resource.get('title', '')}
-            Resource summary: {resource.get('summary', '')}
-            Write a brief, engaging explanation that highlights the connection to the user's interests.
-            """
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            prompt = RELEVANCE_PROMPT.format(
+                interests=user_profile.get('profile_q2_answer', 'General information'),
+                title=resource.get('title', ''),
+                summary=_truncate(resource.get('summary') or '', 1000, 0),
+            )
+            response_text = await self._generate(prompt, cached=True)
+            return response_text.strip()
         except Exception as e:
             logger.error(f"Error generating relevance explanation: {e}")
             return None
     
-    def categorize_resource(self, content: str) -> Optional[str]:
+    async def categorize_resource(self, content: str) -> Optional[str]:
         """
         Categorize the resource into predefined categories.
         Args:
@@ -145,20 +485,14 @@ class AIProcessor:
         Returns:
             Category name or None if failed
         """
+        category = _preclassify(content)
+        if category:
+            logger.debug(f"Pre-classified resource as {category} without Gemini")
+            return category
         try:
-            categories = [
-                "politics", "economy", "society", "technology", "health", 
-                "education", "transport", "housing", "environment", "culture", "sports"
-            ]
-            prompt = f"""
-            Categorize this information resource into one of these categories:
-            {', '.join(categories)}
-            Resource content: {content[:500]}...
-            Return only the category name, nothing else.
-            """
-            response = self.model.generate_content(prompt)
-            category = response.text.strip().lower()
-            if category in categories:
+            response_text = await self._generate(_category_prompt(content), cached=True, similar=("category", content))
+            category = response_text.strip().lower()
+            if category in RESOURCE_CATEGORIES:
                 return category
             else:
                 return "general"
@@ -166,7 +500,67 @@ class AIProcessor:
             logger.error(f"Error categorizing resource: {e}")
             return "general"
     
-    def process_resource(self, resource: Dict, user_profile: Optional[Dict] = None) -> Dict:
+    async def generate_summaries_batch(self, contents: List[str], max_length: int = 200) -> List[Optional[str]]:
+        """
+        Summarize many resources, AI_BATCH_SIZE per request.
+        Falls back to generate_summary for any chunk whose batch response is unusable.
+        Args:
+            contents: Resource contents to summarize
+            max_length: Maximum length of each summary
+        Returns:
+            Summaries in the same order as contents (None where generation failed)
+        """
+        async def summarize_batch(chunk: List[str]) -> Optional[List[Optional[str]]]:
+            resource_list = "\n".join(f"[{i}] {_truncate(content)}" for i, content in enumerate(chunk, 1))
+            prompt = BATCH_SUMMARY_PROMPT.format(count=len(chunk), max_length=max_length, resources=resource_list)
+            return await self._generate_json_list(prompt, len(chunk), "summary")
+
+        async def summarize_chunk(chunk: List[str]) -> List[Optional[str]]:
+            return await self._cached_batch(
+                chunk, lambda content: _summary_prompt(content, max_length), summarize_batch,
+                lambda content: self.generate_summary(content, max_length)
+            )
+
+        return await _gather_chunks(summarize_chunk, contents)
+
+    async def categorize_resources_batch(self, contents: List[str]) -> List[str]:
+        """
+        Categorize many resources, AI_BATCH_SIZE per request.
+        Falls back to categorize_resource for any chunk whose batch response is unusable.
+        Args:
+            contents: Resource contents to categorize
+        Returns:
+            Category names in the same order as contents ("general" if unknown)
+        """
+        results = [_preclassify(content) for content in contents]
+        undecided = [i for i, category in enumerate(results) if category is None]
+        logger.info(f"Keyword pre-classifier settled {len(contents) - len(undecided)} of {len(contents)} resources")
+
+        async def categorize_batch(chunk: List[str]) -> Optional[List[Optional[str]]]:
+            resource_list = "\n".join(f"[{i}] {content[:500]}..." for i, content in enumerate(chunk, 1))
+            prompt = BATCH_CATEGORY_PROMPT.format(count=len(chunk), categories=_CATEGORY_NAMES, resources=resource_list)
+            categories = await self._generate_json_list(prompt, len(chunk), "category")
+            if categories is None:
+                return None
+            # Unknown names are not cached
+            return [c.lower() if c and c.lower() in RESOURCE_CATEGORIES else None for c in categories]
+
+        async def categorize_chunk(chunk: List[str]) -> List[str]:
+            categories = await self._cached_batch(
+                chunk, _category_prompt, categorize_batch, self.categorize_resource, "category"
+            )
+            # Cache hits hold the raw single-call response; normalize like categorize_resource
+            return [
+                c.strip().lower() if c and c.strip().lower() in RESOURCE_CATEGORIES else "general"
+                for c in categories
+            ]
+
+        categories = await _gather_chunks(categorize_chunk, [contents[i] for i in undecided])
+        for i, category in zip(undecided, categories):
+            results[i] = category
+        return results
+
+    async def process_resource(self, resource: Dict, user_profile: Optional[Dict] = None) -> Dict:
         """
         Process a resource with AI enhancements.
         Args:
@@ -176,23 +570,66 @@ class AIProcessor:
             Enhanced resource data
         """
         processed_resource = resource.copy()
-        if not processed_resource.get('summary') and processed_resource.get('content'):
-            summary = self.generate_summary(processed_resource['content'])
-            if summary:
-                processed_resource['summary'] = summary
-        if not processed_resource.get('category') and processed_resource.get('content'):
-            category = self.categorize_resource(processed_resource['content'])
-            if category:
-                processed_resource['category'] = category
+        content = processed_resource.get('content')
+        # Summary and category are independent, so request them concurrently
+        needs_summary = bool(content) and not processed_resource.get('summary')
+        needs_category = bool(content) and not processed_resource.get('category')
+        summary, category = await asyncio.gather(
+            self.generate_summary(content) if needs_summary else _none(),
+            self.categorize_resource(content) if needs_category else _none(),
+        )
+        if summary:
+            processed_resource['summary'] = summary
+        if category:
+            processed_resource['category'] = category
         if user_profile:
             relevance_score = self.calculate_relevance_score(processed_resource, user_profile)
             processed_resource['relevance_score'] = relevance_score
-            explanation = self.generate_relevance_explanation(processed_resource, user_profile)
+            explanation = await self.generate_relevance_explanation(processed_resource, user_profile)
             if explanation:
                 processed_resource['relevance_explanation'] = explanation
         return processed_resource
 
-    def chat_about_article(self, user_message: str, article_context: str = "") -> Optional[str]:
+    async def process_resources_batch(self, resources: List[Dict], user_profile: Optional[Dict] = None) -> List[Dict]:
+        """
+        Process many resources with AI enhancements concurrently.
+        Summaries and categories go out AI_BATCH_SIZE resources per request, and
+        all requests share the GEMINI_CONCURRENCY limit.
+        Args:
+            resources: Resource data dicts
+            user_profile: Optional user profile for personalization
+        Returns:
+            Enhanced resource data, in the same order as resources
+        """
+        processed_resources = [resource.copy() for resource in resources]
+        needs_summary = [r for r in processed_resources if r.get('content') and not r.get('summary')]
+        needs_category = [r for r in processed_resources if r.get('content') and not r.get('category')]
+
+        # Summaries and categories are marshaled AI_BATCH_SIZE resources per request
+        summaries, categories = await asyncio.gather(
+            self.generate_summaries_batch([r['content'] for r in needs_summary]),
+            self.categorize_resources_batch([r['content'] for r in needs_category]),
+        )
+        for resource, summary in zip(needs_summary, summaries):
+            if summary:
+                resource['summary'] = summary
+        for resource, category in zip(needs_category, categories):
+            if category:
+                resource['category'] = category
+
+        if user_profile:
+            for resource in processed_resources:
+                resource['relevance_score'] = self.calculate_relevance_score(resource, user_profile)
+            explanations = await asyncio.gather(*(
+                self.generate_relevance_explanation(resource, user_profile)
+                for resource in processed_resources
+            ))
+            for resource, explanation in zip(processed_resources, explanations):
+                if explanation:
+                    resource['relevance_explanation'] = explanation
+        return processed_resources
+
+    async def chat_about_article(self, user_message: str, article_context: str = "") -> Optional[str]:
         """
         Generate a conversational response about an article or general news topic.
         Args:
@@ -229,16 +666,18 @@ class AIProcessor:
                 Response:
                 """
 
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = await self._generate(prompt)
+            return response_text.strip()
 
         except Exception as e:
             logger.error(f"Error in chat response: {e}")
             return None
 
-    def generate_personalized_insights(self, articles: List[Dict], user_profile: Dict) -> List[Dict]:
+    async def generate_personalized_insights(self, articles: List[Dict], user_profile: Dict) -> List[Dict]:
         """
         Generate personalized insights for a list of articles based on user profile.
+        All articles go to the model in one JSON-mode request; if that fails or
+        returns the wrong number of insights, each article is retried on its own.
         Args:
             articles: List of article dictionaries
             user_profile: User profile with preferences
@@ -246,46 +685,162 @@ class AIProcessor:
             Articles enhanced with personalized insights
         """
         try:
-            enhanced_articles = []
             user_interests = user_profile.get('profile_q2_answer', '')
             user_goals = user_profile.get('profile_q1_answer', '')
 
-            for article in articles:
+            insights = await self._generate_insights_batch(articles, user_goals, user_interests)
+            if insights is None:
+                insights = await asyncio.gather(*(
+                    self._generate_insight(article, user_goals, user_interests)
+                    for article in articles
+                ))
+
+            enhanced_articles = []
+            for article, insight in zip(articles, insights):
                 enhanced_article = article.copy()
+                enhanced_article['personalized_insight'] = insight
+                enhanced_articles.append(enhanced_article)
 
-                # Generate personalized insight
-                prompt = f"""
-                Based on this user's profile:
-                - Goals: {user_goals}
-                - Interests: {user_interests}
+            return enhanced_articles
+
+        except Exception as e:
+            logger.error(f"Error generating personalized insights: {e}")
+            return articles
+
+    async def _generate_insights_batch(self, articles: List[Dict], user_goals: str, user_interests: str) -> Optional[List[Optional[str]]]:
+        """
+        Generate one insight per article with a single request.
+        Returns:
+            Insights in article order, or None if the batch response is unusable
+        """
+        if not articles:
+            return []
+
+        article_list = "\n".join(
+            f"{i}. Title: {article.get('title', '')}\n   Summary: {article.get('summary', '')}"
+            for i, article in enumerate(articles, 1)
+        )
+        prompt = f"""
+        Based on this user's profile:
+        - Goals: {user_goals}
+        - Interests: {user_interests}
+
+        And these {len(articles)} articles:
+        {article_list}
+
+        For each article, generate a brief, personalized insight (1-2 sentences) explaining why
+        it might be valuable to this specific user. Focus on actionable insights or connections
+        to their goals and interests.
+
+        Return a JSON array of exactly {len(articles)} strings, one per article, in the same order.
+        """
 
-                And this article:
-                - Title: {article.get('title', '')}
-                - Summary: {article.get('summary', '')}
+        return await self._generate_json_list(prompt, len(articles), "insight")
 
-                Generate a brief, personalized insight (1-2 sentences) explaining why this article
-                might be valuable to this specific user. Focus on actionable insights or connections
-                to their goals and interests.
+    async def _cached_batch(self, items: List[str], single_prompt, batch_request, single_call,
+                            namespace: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Resolve a chunk from the AI cache, batching only the misses.
+        Each item is cached under the key of its single-item prompt, so batched
+        and per-item calls share entries. Exact misses are then looked up in the
+        semantic cache under namespace, if given.
+        Args:
+            items: Contents in the chunk
+            single_prompt: Builds an item's single-item prompt
+            batch_request: Coroutine function returning results for a list of
+                items, or None if the batch response is unusable
+            single_call: Per-item coroutine function used as the fallback
+            namespace: Semantic cache namespace for near-duplicate lookups
+        Returns:
+            Results in the same order as items
+        """
+        keys = [AICache.make_key(GEMINI_MODEL, single_prompt(item)) for item in items]
+        similar = [(namespace, item) if namespace else None for item in items]
+        results = await asyncio.to_thread(
+            lambda: [self._cache_lookup(key, pair) for key, pair in zip(keys, similar)]
+        )
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            todo = [items[i] for i in missing]
+            fresh = await batch_request(todo)
+            if fresh is None:
+                # Per-item calls cache their own responses
+                fresh = await asyncio.gather(*(single_call(item) for item in todo))
+            else:
+                stored = [(keys[i], value, similar[i]) for i, value in zip(missing, fresh) if value]
+                await asyncio.to_thread(lambda: [self._cache_store(*entry) for entry in stored])
+            for i, value in zip(missing, fresh):
+                results[i] = value
+        return results
 
-                Insight:
-                """
+    def _cache_lookup(self, key: str, similar: Optional[Tuple[str, str]]) -> Optional[str]:
+        """
+        Look a response up by exact key, then by content similarity.
+        Blocking; callers run it via asyncio.to_thread.
+        """
+        hit = self._cache.get(key)
+        if hit is None and similar and self._semantic:
+            # Not written back under key: a near-duplicate's response must
+            # never become this content's exact-cache entry
+            hit = self._semantic.get(*similar)
+        return hit
+
+    def _cache_store(self, key: str, text: str, similar: Optional[Tuple[str, str]]):
+        """Store a fresh response in the exact and semantic caches. Blocking."""
+        self._cache.set(key, text)
+        if similar and self._semantic:
+            self._semantic.put(*similar, text)
+
+    async def _generate_json_list(self, prompt: str, count: int, what: str) -> Optional[List[Optional[str]]]:
+        """
+        Send a batch prompt in JSON mode and parse its array of count strings.
+        Returns:
+            The stripped strings (None for non-string items), or None if the
+            request fails or the array has the wrong length
+        """
+        try:
+            response_text = await self._generate(
+                prompt,
+                generation_config={'responseMimeType': 'application/json'}
+            )
+            items = orjson.loads(response_text)
+        except Exception as e:
+            logger.warning(f"Batch {what} generation failed, falling back to per-item: {e}")
+            return None
 
-                try:
-                    response = self.model.generate_content(prompt)
-                    enhanced_article['personalized_insight'] = response.text.strip()
-                except Exception as e:
-                    logger.error(f"Error generating insight for article {article.get('id', 'unknown')}: {e}")
-                    enhanced_article['personalized_insight'] = None
+        if not isinstance(items, list) or len(items) != count:
+            logger.warning(f"Batch {what} response did not match the item count, falling back to per-item")
+            return None
+        return [item.strip() if isinstance(item, str) else None for item in items]
 
-                enhanced_articles.append(enhanced_article)
+    async def _generate_insight(self, article: Dict, user_goals: str, user_interests: str) -> Optional[str]:
+        """
+        Generate a personalized insight for a single article.
+        """
+        prompt = f"""
+        Based on this user's profile:
+        - Goals: {user_goals}
+        - Interests: {user_interests}
 
-            return enhanced_articles
+        And this article:
+        - Title: {article.get('title', '')}
+        - Summary: {article.get('summary', '')}
+
+        Generate a brief, personalized insight (1-2 sentences) explaining why this article
+        might be valuable to this specific user. Focus on actionable insights or connections
+        to their goals and interests.
+
+        Insight:
+        """
 
+        try:
+            response_text = await self._generate(prompt)
+            return response_text.strip()
         except Exception as e:
-            logger.error(f"Error generating personalized insights: {e}")
-            return articles
+            logger.error(f"Error generating insight for article {article.get('id', 'unknown')}: {e}")
+            return None
 
-    def generate_daily_briefing(self, articles: List[Dict], user_profile: Dict) -> Optional[str]:
+    async def generate_daily_briefing(self, articles: List[Dict], user_profile: Dict) -> Optional[str]:
         """
         Generate a personalized daily news briefing.
         Args:
@@ -320,14 +875,14 @@ class AIProcessor:
             Daily Briefing:
             """
 
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = await self._generate(prompt)
+            return response_text.strip()
 
         except Exception as e:
             logger.error(f"Error generating daily briefing: {e}")
             return None
 
-    def analyze_sentiment(self, content: str) -> Optional[Dict]:
+    async def analyze_sentiment(self, content: str) -> Optional[Dict]:
         """
         Analyze the sentiment of article content.
         Args:
@@ -341,28 +896,29 @@ class AIProcessor:
 
             {content[:1000]}...
 
-            Provide analysis in this format:
-            Sentiment: [Positive/Negative/Neutral]
-            Confidence: [High/Medium/Low]
-            Key Emotions: [list main emotions detected]
-            Tone: [Professional/Casual/Urgent/etc.]
-
-            Analysis:
+            Respond with a JSON object with exactly these string fields:
+            "sentiment": Positive, Negative or Neutral
+            "confidence": High, Medium or Low
+            "key_emotions": the main emotions detected, comma-separated
+            "tone": Professional, Casual, Urgent, etc.
             """
 
-            response = self.model.generate_content(prompt)
-            analysis_text = response.text.strip()
-
-            # Parse the response (simplified parsing)
-            lines = analysis_text.split('\n')
-            result = {}
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    result[key.strip().lower().replace(' ', '_')] = value.strip()
+            response_text = await self._generate(
+                prompt,
+                generation_config={'responseMimeType': 'application/json'}
+            )
+            result = orjson.loads(response_text)
+            if not isinstance(result, dict):
+                logger.error("Sentiment response was not a JSON object")
+                return None
 
             return result
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {e}")
-            return None
\ No newline at end of file
+            return None
+
+@lru_cache(maxsize=1)
+def get_ai_processor() -> AIProcessor:
+    """Return the process-wide AI processor, so every caller shares one concurrency limit and cache."""
+    return AIProcessor()
@@ -0,0 +1,150 @@
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+import orjson
+from sqlalchemy import or_
+
+from ..database.connection import SessionLocal
+from ..models.resource import Resource
+from .ai_cache import AICache, get_ai_cache
+from .ai_processor import GEMINI_MODEL, RESOURCE_CATEGORIES, _category_prompt, _summary_prompt, get_ai_processor
+
+logger = logging.getLogger(__name__)
+
+# Submitted Batch Mode jobs still awaiting results: batch name -> resource IDs
+PENDING_BATCHES_FILE = 'data/gemini_batches.json'
+
+# Guards read-modify-write of the pending file; submit and poll jobs run on
+# separate scheduler threads
+_PENDING_LOCK = threading.Lock()
+
+# Resources enriched per offline pass
+OFFLINE_BATCH_LIMIT = 2000
+
+def _load_pending() -> Dict[str, List[str]]:
+    """Read the pending batch jobs, or none if the file is missing or unreadable."""
+    try:
+        with open(PENDING_BATCHES_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def _save_pending(pending: Dict[str, List[str]]):
+    """Write the pending batch jobs."""
+    os.makedirs(os.path.dirname(PENDING_BATCHES_FILE), exist_ok=True)
+    with open(PENDING_BATCHES_FILE, 'wb') as f:
+        f.write(orjson.dumps(pending))
+
+def _update_pending(added: Optional[Dict[str, List[str]]] = None, finished: List[str] = ()):
+    """Record submitted and finished batch jobs against the file's current contents."""
+    with _PENDING_LOCK:
+        pending = _load_pending()
+        pending.update(added or {})
+        for batch_name in finished:
+            pending.pop(batch_name, None)
+        _save_pending(pending)
+
+async def process_articles_batch_offline() -> Optional[str]:
+    """
+    Submit summaries and categories for unenriched articles as one Gemini batch job.
+    Articles already in a pending job are skipped; poll_offline_batches writes
+    the results back once the job finishes.
+    Returns:
+        The batch name, or None if nothing was submitted
+    """
+    pending = _load_pending()
+    in_flight = {resource_id for resource_ids in pending.values() for resource_id in resource_ids}
+    prompts = {}
+    db = SessionLocal()
+    try:
+        resources = db.query(Resource).filter(
+            Resource.status == 'active',
+            Resource.content.isnot(None),
+            or_(Resource.summary.is_(None), Resource.category.is_(None))
+        ).limit(OFFLINE_BATCH_LIMIT).all()
+        for resource in resources:
+            if resource.resource_id in in_flight:
+                continue
+            if not resource.summary:
+                prompts[f"{resource.resource_id}|summary"] = _summary_prompt(resource.content, 200)
+            if not resource.category:
+                prompts[f"{resource.resource_id}|category"] = _category_prompt(resource.content)
+    finally:
+        db.close()
+
+    if not prompts:
+        logger.info("No articles need offline enrichment")
+        return None
+    batch_name = await get_ai_processor().submit_batch(prompts)
+    if batch_name:
+        _update_pending(added={batch_name: sorted({key.rsplit('|', 1)[0] for key in prompts})})
+        logger.info(f"Submitted {len(prompts)} enrichment prompts as {batch_name}")
+    return batch_name
+
+def _apply_results(results: Dict[str, Optional[str]]) -> Optional[int]:
+    """
+    Write batch results onto their resources and into the AI cache.
+    Returns:
+        Number of resources updated, or None if the write failed and the
+        batch should be applied again on the next poll
+    """
+    by_resource: Dict[str, Dict[str, str]] = {}
+    for key, text in results.items():
+        if key and text:
+            resource_id, kind = key.rsplit('|', 1)
+            by_resource.setdefault(resource_id, {})[kind] = text.strip()
+    if not by_resource:
+        return 0
+
+    cache = get_ai_cache()
+    db = SessionLocal()
+    try:
+        resources = db.query(Resource).filter(Resource.resource_id.in_(list(by_resource))).all()
+        for resource in resources:
+            values = by_resource[resource.resource_id]
+            summary = values.get('summary')
+            if summary:
+                # Cached under the single-item prompt, so online calls reuse it
+                cache.set(AICache.make_key(GEMINI_MODEL, _summary_prompt(resource.content, 200)), summary)
+                resource.summary = resource.summary or summary
+            category = values.get('category')
+            if category:
+                cache.set(AICache.make_key(GEMINI_MODEL, _category_prompt(resource.content)), category)
+                category = category.lower()
+                resource.category = resource.category or (category if category in RESOURCE_CATEGORIES else "general")
+        db.commit()
+        return len(resources)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error applying batch results: {e}")
+        return None
+    finally:
+        db.close()
+
+async def poll_offline_batches() -> int:
+    """
+    Check pending batch jobs and write back the results of finished ones.
+    Returns:
+        Number of resources updated
+    """
+    pending = _load_pending()
+    if not pending:
+        return 0
+    processor = get_ai_processor()
+    updated = 0
+    finished = []
+    for batch_name in pending:
+        results = await processor.get_batch_results(batch_name)
+        if results is None:
+            continue
+        applied = _apply_results(results)
+        if applied is None:
+            continue
+        updated += applied
+        finished.append(batch_name)
+    if finished:
+        _update_pending(finished=finished)
+    if updated:
+        logger.info(f"Applied offline enrichment to {updated} resources")
+    return updated
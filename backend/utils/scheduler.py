@@ -1,7 +1,10 @@
+import asyncio
+import hashlib
 import logging
+from functools import partial
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
 import os
 from dotenv import load_dotenv
 
@@ -12,12 +15,32 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scraping jobs are I/O-bound, so the pool is far wider than APScheduler's default 10
+SCHEDULER_WORKERS = 50
+
+# Overlapping cron runs collapse into one, a late run still fires within
+# five minutes, and a slow run does not block the next one from starting
+JOB_DEFAULTS = {'coalesce': True, 'max_instances': 3, 'misfire_grace_time': 300}
+
+def _run_coroutine(job_function):
+    """Run an async job to completion on the executor thread that picked it up."""
+    return asyncio.run(job_function())
+
+def _default_job_id(job_function, schedule_type, schedule_args) -> str:
+    """Derive a stable job ID from the function and its schedule, so re-adding a job replaces it."""
+    name = getattr(job_function, '__qualname__', repr(job_function))
+    key = f"{name}|{schedule_type}|{sorted(schedule_args.items())}"
+    return f"scrape_{hashlib.md5(key.encode()).hexdigest()[:12]}"
+
 class ScrapingScheduler:
     """Manages automated scraping schedules using APScheduler."""
     
     def __init__(self):
         """Initialize the scheduler."""
-        self.scheduler = BackgroundScheduler()
+        self.scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(SCHEDULER_WORKERS)},
+            job_defaults=JOB_DEFAULTS
+        )
         self.is_running = False
         
     def start(self):
@@ -34,29 +57,38 @@ class ScrapingScheduler:
             self.is_running = False
             logger.info("Scraping scheduler stopped")
     
-    def add_scraping_job(self, job_function, schedule_type='cron', **schedule_args):
+    def add_scraping_job(self, job_function, schedule_type='cron', job_id=None, max_instances=None, **schedule_args):
         """
         Add a scraping job to the scheduler.
         
         Args:
-            job_function: Function to execute
+            job_function: Function or coroutine function to execute
             schedule_type: Type of schedule ('cron', 'interval', 'date')
+            job_id: Stable job ID; adding a job with the same ID replaces it.
+                Defaults to a hash of the function and its schedule
+            max_instances: Concurrent runs allowed; defaults to JOB_DEFAULTS
             **schedule_args: Schedule parameters
         """
         try:
+            if job_id is None:
+                job_id = _default_job_id(job_function, schedule_type, schedule_args)
             if schedule_type == 'cron':
                 trigger = CronTrigger(**schedule_args)
             else:
                 trigger = schedule_type
+
+            if asyncio.iscoroutinefunction(job_function):
+                job_function = partial(_run_coroutine, job_function)
                 
             self.scheduler.add_job(
                 func=job_function,
                 trigger=trigger,
-                id=f'scraping_job_{datetime.now().strftime("%Y%m%d_%H%M%S")}',
+                id=job_id,
                 name='News Scraping Job',
-                replace_existing=True
+                replace_existing=True,
+                max_instances=max_instances or JOB_DEFAULTS['max_instances']
             )
-            logger.info(f"Added scraping job with {schedule_type} schedule")
+            logger.info(f"Added scraping job {job_id} with {schedule_type} schedule")
             
         except Exception as e:
             logger.error(f"Error adding scraping job: {e}")
@@ -66,12 +98,13 @@ class ScrapingScheduler:
         Set up the default scraping schedule.
         
         Args:
-            scraping_function: Function to execute for scraping
+            scraping_function: Function or coroutine function to execute for scraping
         """
         # Run scraping every 30 minutes during business hours (8 AM - 8 PM)
         self.add_scraping_job(
             job_function=scraping_function,
             schedule_type='cron',
+            job_id='scrape_business_hours',
             minute='*/30',
             hour='8-20',
             day_of_week='mon-fri'
@@ -81,10 +114,31 @@ class ScrapingScheduler:
         self.add_scraping_job(
             job_function=scraping_function,
             schedule_type='cron',
+            job_id='scrape_daily',
             hour=6,
             minute=0
         )
-        
+
+        # Enrich the daily haul through Gemini Batch Mode once it is scraped;
+        # the 30-minute runs stay on the synchronous API. Both jobs rewrite the
+        # pending-batch file, so each runs one instance at a time.
+        from .batch_enrichment import poll_offline_batches, process_articles_batch_offline
+        self.add_scraping_job(
+            job_function=process_articles_batch_offline,
+            schedule_type='cron',
+            job_id='enrich_offline',
+            max_instances=1,
+            hour=6,
+            minute=30
+        )
+        self.add_scraping_job(
+            job_function=poll_offline_batches,
+            schedule_type='cron',
+            job_id='enrich_offline_poll',
+            max_instances=1,
+            minute='*/15'
+        )
+
         logger.info("Default scraping schedule configured")
     
     def get_jobs(self):
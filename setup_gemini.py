@@ -4,7 +4,9 @@ Setup script for Singapore News Intelligence Dashboard with Gemini AI
 This script helps configure the environment and test the Gemini integration.
 """
 
+import asyncio
 import os
+import shutil
 import sys
 import subprocess
 from pathlib import Path
@@ -53,17 +55,28 @@ def setup_backend():
     if os.name == 'nt':  # Windows
         activate_script = "venv\\Scripts\\activate"
         pip_path = "venv\\Scripts\\pip"
+        python_path = "venv\\Scripts\\python"
     else:  # Unix/Linux/macOS
         activate_script = "venv/bin/activate"
         pip_path = "venv/bin/pip"
+        python_path = "venv/bin/python"
     
     print(f"Virtual environment created. Activate with: {activate_script}")
     
     # Install requirements
     if Path("requirements.txt").exists():
-        print("Installing Python dependencies...")
-        subprocess.run([pip_path, "install", "-r", "requirements.txt"])
-        print("✅ Backend dependencies installed")
+        # uv resolves and installs the pinned requirements far faster than pip
+        if shutil.which("uv"):
+            print("Installing Python dependencies with uv...")
+            command = ["uv", "pip", "install", "--python", python_path, "-r", "requirements.txt"]
+        else:
+            print("Installing Python dependencies...")
+            command = [pip_path, "install", "-r", "requirements.txt"]
+        result = subprocess.run(command)
+        if result.returncode == 0:
+            print("✅ Backend dependencies installed")
+        else:
+            print("❌ Failed to install backend dependencies")
     else:
         print("❌ requirements.txt not found")
 
@@ -128,7 +141,7 @@ def test_gemini_connection():
         
         # Test with a simple prompt
         test_content = "Singapore's economy continues to grow with new tech investments."
-        result = processor.generate_summary(test_content, 50)
+        result = asyncio.run(processor.generate_summary(test_content, 50))
         
         if result:
             print("✅ Gemini AI connection successful!")